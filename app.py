@@ -1,14 +1,41 @@
 import logging
+import os
+import time
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 # Import routers
 from routers import piping, sizing, flow, pump, reactor, components_router, mass_balance
+from routers.utils import ORJSONResponse
+
+logger = logging.getLogger("uvicorn")
+
+# Fluids whose CoolProp states are loaded before serving (comma-separated; empty disables)
+WARMUP_FLUIDS = os.environ.get("WARMUP_FLUIDS", "Water,Air,Nitrogen,CarbonDioxide,Methane")
+
+
+@asynccontextmanager
+async def lifespan(app):
+    # Loading a fluid's HEOS model is paid on first use; do it here, not on the first request
+    start = time.perf_counter()
+    fluids = [fluid.strip() for fluid in WARMUP_FLUIDS.split(",") if fluid.strip()]
+    for fluid in fluids:
+        try:
+            components_router.components_obj.warm_up(fluid)
+        except ValueError as exc:
+            logger.warning(f"Skipping warm-up: {exc}")
+    if fluids:
+        logger.info(f"CoolProp warm-up of {len(fluids)} fluid(s) took {time.perf_counter() - start:.2f} s")
+    yield
+
 
 app = FastAPI(
     title="Chemical Engineering API",
     description="API for chemical engineering calculations",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -19,8 +46,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-logger = logging.getLogger("uvicorn")
-
 # Include routers
 app.include_router(piping.router)
 app.include_router(sizing.router)
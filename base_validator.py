@@ -7,5 +7,7 @@ class BaseValidator:
             raise ValueError(f"Missing parameter(s): {', '.join(missing)}")
 
     def _validate_numeric(self, params: Dict[str, object], keys: Sequence[str]) -> None:
-        if not all(isinstance(params[k], (int, float)) for k in keys):
-            raise TypeError("All parameters must be numeric (int or float).")
\ No newline at end of file
+        for k in keys:
+            value = params[k]
+            if not isinstance(value, (int, float)):
+                raise TypeError(f"Parameter '{k}' must be numeric (int or float), got {type(value).__name__}.")
\ No newline at end of file
@@ -43,6 +43,42 @@ const API = {
         }
     },
 
+    /**
+     * API call for endpoints that answer with an image (e.g. image/png plots)
+     * @param {string} endpoint - API endpoint
+     * @param {string} method - HTTP method (GET, POST)
+     * @param {Object} data - Data to send (for POST requests)
+     * @returns {Promise} - Promise with an object URL for the image
+     */
+    async callImage(endpoint, method = 'GET', data = null) {
+        try {
+            const url = `${this.baseUrl}${endpoint}`;
+            const options = {
+                method,
+                headers: {
+                    'Content-Type': 'application/json',
+                    'Accept': 'image/png'
+                }
+            };
+
+            if (data && method === 'POST') {
+                options.body = JSON.stringify(data);
+            }
+
+            const response = await fetch(url, options);
+            
+            if (!response.ok) {
+                const errorData = await response.json();
+                throw new Error(errorData.detail || 'API request failed');
+            }
+
+            return URL.createObjectURL(await response.blob());
+        } catch (error) {
+            console.error('API Error:', error);
+            throw error;
+        }
+    },
+
     // ---------------------------------------------------------------------------
     // Piping Endpoints
     // ---------------------------------------------------------------------------
@@ -163,7 +199,7 @@ const API = {
     },
 
     async plotConversionVsVolume(params) {
-        return this.call('/reactor/plot-conversion-vs-volume', 'POST', params);
+        return this.callImage('/reactor/plot-conversion-vs-volume', 'POST', params);
     },
 
     async calculateLimitingReagent(params) {
@@ -239,7 +275,7 @@ const API = {
     },
     
     async plotMassBalance(params) {
-        return this.call('/mass-balance/plot', 'POST', params);
+        return this.callImage('/mass-balance/plot', 'POST', params);
     }
 };
 
@@ -840,9 +840,9 @@ const BalanceModule = {
             UI.hideResult('#balance-result');
             UI.hideResult('#plot-result-mass-balance');
             
-            const result = await API.plotMassBalance(data);
+            const imageUrl = await API.plotMassBalance(data);
 
-            if (result.image_base64) {
+            if (imageUrl) {
                 
                 // Create a placeholder first with fixed dimensions
                 const plotResultElement = document.getElementById('plot-result-mass-balance');
@@ -854,7 +854,8 @@ const BalanceModule = {
                 // Set placeholder HTML
                 plotResultElement.innerHTML = `
                     <div class="plot-container">
-                        <img src="data:image/png;base64,${result.image_base64}" 
+                        <img src="${imageUrl}" 
+                             onload="URL.revokeObjectURL(this.src)"
                              alt="Mass Balance Plot" 
                              style="max-width:100%; height:auto; display:block;"
                         >
@@ -847,17 +847,20 @@ const ReactorModule = {
             // Send request to API
             UI.showLoading('#plot-conversion-form');
             
-            const result = await API.plotConversionVsVolume(payload);
+            const imageUrl = await API.plotConversionVsVolume(payload);
             
             // Display the plot
-            if (result && result.image_base64) {
+            if (imageUrl) {
                 // Get the result container and make it visible
                 const plotResultContainer = document.getElementById('plot-result-reactor');
                 plotResultContainer.classList.remove('hidden');
                 
                 // Set the image source
                 const plotImage = document.getElementById('conversion-plot-image');
-                plotImage.src = `data:image/png;base64,${result.image_base64}`;
+                if (plotImage.src.startsWith('blob:')) {
+                    URL.revokeObjectURL(plotImage.src);  // Release the previous plot
+                }
+                plotImage.src = imageUrl;
                 
                 // Make sure the image is visible
                 plotImage.style.display = 'block';
@@ -1,14 +1,235 @@
+import math
+import threading
+from functools import lru_cache
+
 import CoolProp.CoolProp as CP
 from CoolProp.CoolProp import FluidsList
+import numpy as np
 import pint
+from scipy.interpolate import RBFInterpolator
+from scipy.stats import qmc
+
+# Fluids known to CoolProp; the list never changes at runtime
+_FLUIDS_LIST = tuple(FluidsList())
+_FLUIDS = frozenset(_FLUIDS_LIST)
+
+# AbstractState objects hold the last flash; serialize update + read sequences
+_STATE_LOCK = threading.Lock()
+
+# Fitted (fluid, property) surrogates, see Components.enable_surrogate
+_SURROGATES = {}
+
+# Units of the returned properties, kept as plain strings (pint formatting)
+UNITS = {
+    "temperature": "kelvin",
+    "pressure": "pascal",
+    "density": "kilogram / meter ** 3",
+    "specific_heat": "joule / kelvin / kilogram",
+    "viscosity": "pascal * second",
+    "conductivity": "watt / kelvin / meter",
+    "thermal_conductivity": "watt / kelvin / meter",
+    "enthalpy": "joule / kilogram",
+    "entropy": "joule / kelvin / kilogram",
+    "molecular_weight": "kilogram / mole",
+    "surface_tension": "newton / meter",
+    "vapor_pressure": "pascal",
+    "bubble_point_temperature": "kelvin",
+    "dew_point_temperature": "kelvin",
+    "bubble_point_pressure": "pascal",
+    "dew_point_pressure": "pascal",
+    "critical_temperature": "kelvin",
+    "critical_pressure": "pascal",
+    "critical_density": "kilogram / meter ** 3",
+    "triple_point_temperature": "kelvin",
+    "triple_point_pressure": "pascal",
+}
+
+# Fluid constants, in the order _critical_constants returns them
+_CRITICAL_NAMES = (
+    "critical_temperature",
+    "critical_pressure",
+    "critical_density",
+    "triple_point_temperature",
+    "triple_point_pressure",
+)
+
+# Units of the CoolProp output keys
+_KEY_UNITS = {
+    "D": UNITS["density"],
+    "C": UNITS["specific_heat"],
+    "V": UNITS["viscosity"],
+    "L": UNITS["conductivity"],
+    "H": UNITS["enthalpy"],
+    "S": UNITS["entropy"],
+    "M": UNITS["molecular_weight"],
+    "I": UNITS["surface_tension"],
+    "P": UNITS["pressure"],
+    "T": UNITS["temperature"],
+    "T_bubble": UNITS["bubble_point_temperature"],
+    "T_dew": UNITS["dew_point_temperature"],
+    "P_bubble": UNITS["bubble_point_pressure"],
+    "P_dew": UNITS["dew_point_pressure"],
+}
+
+# Bubble/dew point keys -> (output, given input) of a Q=0 saturation flash
+_SATURATION_PROPERTIES = {
+    "T_bubble": ("T", "P"),
+    "T_dew": ("T", "P"),
+    "P_bubble": ("P", "T"),
+    "P_dew": ("P", "T"),
+}
+
+# Result keys of the mixture properties
+_PROPERTY_KEY_MAP = {
+    "D": "density",
+    "C": "specific_heat",
+    "V": "viscosity",
+    "L": "thermal_conductivity",
+    "H": "enthalpy",
+    "S": "entropy",
+    "M": "molecular_weight",
+    "I": "surface_tension",
+    "P": "pressure",
+    "T": "temperature"
+}
+_MIXTURE_DEFAULT_PROPERTIES = ("D", "C", "V", "L", "H", "S", "M", "I", "P", "T")
+
+# Outputs a PT-flashed mixture cannot provide: surface tension is not implemented
+# for mixtures, and heat capacity/transport properties are undefined in two-phase
+_MIXTURE_UNAVAILABLE = frozenset({"I"})
+_MIXTURE_UNAVAILABLE_BY_PHASE = {
+    CP.iphase_twophase: frozenset({"I", "C", "V", "L"}),
+}
+
+# Available property keys and their descriptions
+_PROPERTY_NAMES = {
+    "D": "Density [kg/m³]",
+    "C": "Specific heat [J/(kg·K)]",
+    "V": "Viscosity [Pa·s]",
+    "L": "Thermal conductivity [W/(m·K)]",
+    "H": "Enthalpy [J/kg]",
+    "S": "Entropy [J/(kg·K)]",
+    "M": "Molar mass [kg/mol]",
+    "I": "Surface tension [N/m]",
+    "P": "Pressure [Pa]",
+    "T": "Temperature [K]",
+    "Q": "Quality (vapor fraction) [kg/kg]",
+    "U": "Internal energy [J/kg]",
+    "A": "Speed of sound [m/s]",
+    "Z": "Compressibility factor [-]",
+    "T_bubble": "Bubble point temperature [K]",
+    "T_dew": "Dew point temperature [K]",
+    "P_bubble": "Bubble point pressure [Pa]",
+    "P_dew": "Dew point pressure [Pa]"
+}
+
+_PROPERTY_MIXTURE_NAMES = {
+    "D": "Density [kg/m³]",
+    "C": "Specific heat [J/(kg·K)]",
+    "V": "Viscosity [Pa·s]",
+    "L": "Thermal conductivity [W/(m·K)]",
+    "H": "Enthalpy [J/kg]",
+    "S": "Entropy [J/(kg·K)]",
+    "M": "Molar mass [kg/mol]",
+    "I": "Surface tension [N/m]",
+    "P": "Pressure [Pa]",
+    "T": "Temperature [K]"
+}
+
+
+def _flat(value, units):
+    """Returns a {value, units} dict, or None when the value is not available"""
+    if value is None:
+        return None
+    return {"value": value, "units": units}
+
+
+@lru_cache(maxsize=64)
+def _saturation_state(fluid):
+    """Returns a persistent HEOS state used for saturation (QT/PQ) and exact PT flashes"""
+    return CP.AbstractState("HEOS", fluid)
+
+
+@lru_cache(maxsize=32)
+def _mixture_state(composition):
+    """Returns a persistent HEOS state for a mixture given as ((fluid, fraction), ...)"""
+    fluids, fractions = zip(*composition)
+    state = CP.AbstractState("HEOS", "&".join(fluids))
+    # Same basis as the "fluid[fraction]" mixture string PropsSI used before
+    state.set_mole_fractions(list(fractions))
+    return state
+
+
+@lru_cache(maxsize=256)
+def _critical_constants(fluid):
+    """Returns the fluid's critical and triple point constants (see _CRITICAL_NAMES)"""
+    state = _saturation_state(fluid)
+    return (state.T_critical(), state.p_critical(), state.rhomass_critical(),
+            state.Ttriple(), state.trivial_keyed_output(CP.iP_triple))
+
+
+def _critical_point(fluid):
+    """Returns the (temperature, pressure) of the fluid's critical point"""
+    return _critical_constants(fluid)[:2]
+
+
+class _Surrogate:
+    """RBF fit of one (fluid, property) pair over a temperature/pressure box"""
+    
+    def __init__(self, fluid, prop, T_range, P_range, n):
+        self.T_min, self.T_max = map(float, T_range)
+        self.P_min, self.P_max = map(float, P_range)
+        if not (self.T_min < self.T_max and self.P_min < self.P_max):
+            raise ValueError("T_range and P_range must be (min, max) with min < max")
+        
+        # Low-discrepancy samples over the box, evaluated in one vectorized call
+        samples = qmc.scale(qmc.Halton(d=2, seed=0).random(n),
+                            [self.T_min, self.P_min], [self.T_max, self.P_max])
+        try:
+            values = np.asarray(CP.PropsSI(prop, "T", samples[:, 0], "P", samples[:, 1], fluid), dtype=float)
+        except ValueError:
+            values = np.full(n, np.inf)
+        
+        ok = np.isfinite(values)
+        if ok.sum() < 3:
+            raise ValueError(f"Property '{prop}' could not be sampled for '{fluid}' in the given range")
+        
+        # log1p compresses strictly positive outputs (density, viscosity, ...)
+        self.log = bool(np.all(values[ok] > 0))
+        targets = np.log1p(values[ok]) if self.log else values[ok]
+        self.rbf = RBFInterpolator(self._scale(samples[ok, 0], samples[ok, 1]), targets,
+                                   kernel="thin_plate_spline")
+    
+    def _scale(self, T, P):
+        return np.column_stack(((T - self.T_min) / (self.T_max - self.T_min),
+                                (P - self.P_min) / (self.P_max - self.P_min)))
+    
+    def covers(self, temperature, pressure):
+        return self.T_min <= temperature <= self.T_max and self.P_min <= pressure <= self.P_max
+    
+    def __call__(self, temperature, pressure):
+        value = float(self.rbf(self._scale(np.array([temperature]), np.array([pressure])))[0])
+        return math.expm1(value) if self.log else value
+
 
 class Components:
-    def __init__(self):
-        self.ureg = pint.UnitRegistry()
+    # pint's process-wide registry: unit definitions are parsed once, on first use
+    ureg = pint.get_application_registry()
+        
+    def warm_up(self, fluid):
+        """Creates the cached state of a fluid, loading its HEOS model and critical constants"""
+        if fluid not in _FLUIDS:
+            raise ValueError(f"Fluid '{fluid}' not found")
+        _saturation_state(fluid)
+        _critical_point(fluid)
         
     def list_all_components(self):
         """Returns a list of all available components/fluids"""
-        return FluidsList()
+        return list(_FLUIDS_LIST)
+
+    def to_quantity(self, prop):
+        """Builds a pint Quantity from a {"value", "units"} property dict"""
+        return self.ureg.Quantity(prop["value"], prop["units"])
     
     def get_all_properties(self, fluid, temperature, pressure):
         """
@@ -26,50 +247,69 @@ class Components:
         Returns:
         --------
         dict
-            Dictionary containing all available properties
+            Dictionary mapping each property to {"value", "units"} (None if unavailable)
         """
-        if fluid not in self.list_all_components():
+        if fluid not in _FLUIDS:
             raise ValueError(f"Fluid '{fluid}' not found")
         
-        properties = {}
-        properties["temperature"] = temperature * self.ureg.kelvin
-        properties["pressure"] = pressure * self.ureg.pascal
-        
-        # Get basic properties
-        properties["density"] = CP.PropsSI("D", "T", temperature, "P", pressure, fluid) * self.ureg.kg / self.ureg.m**3
-        properties["specific_heat"] = CP.PropsSI("C", "T", temperature, "P", pressure, fluid) * self.ureg.joule / (self.ureg.kg * self.ureg.kelvin)
-        properties["viscosity"] = CP.PropsSI("V", "T", temperature, "P", pressure, fluid) * self.ureg.pascal * self.ureg.second
-        properties["conductivity"] = CP.PropsSI("L", "T", temperature, "P", pressure, fluid) * self.ureg.watt / (self.ureg.meter * self.ureg.kelvin)
-        properties["enthalpy"] = CP.PropsSI("H", "T", temperature, "P", pressure, fluid) * self.ureg.joule / self.ureg.kg
-        properties["entropy"] = CP.PropsSI("S", "T", temperature, "P", pressure, fluid) * self.ureg.joule / (self.ureg.kg * self.ureg.kelvin)
-        properties["molecular_weight"] = CP.PropsSI("M", "T", temperature, "P", pressure, fluid) * self.ureg.kg / self.ureg.mol
-        
-        try:
-            properties["surface_tension"] = CP.PropsSI("I", "T", temperature, "P", pressure, fluid) * self.ureg.newton / self.ureg.meter
-        except:
-            properties["surface_tension"] = None
-            
-        try:
-            properties["vapor_pressure"] = CP.PropsSI("P", "T", temperature, "Q", 1, fluid) * self.ureg.pascal
-        except:
-            properties["vapor_pressure"] = None
-            
-        # Add bubble and dew points (for pure fluids, these are the same as saturation properties)
-        try:
-            sat_temperature = CP.PropsSI("T", "P", pressure, "Q", 0, fluid)
-            properties["bubble_point_temperature"] = sat_temperature * self.ureg.kelvin
-            properties["dew_point_temperature"] = sat_temperature * self.ureg.kelvin
-        except:
-            properties["bubble_point_temperature"] = None
-            properties["dew_point_temperature"] = None
-            
-        try:
-            sat_pressure = CP.PropsSI("P", "T", temperature, "Q", 0, fluid)
-            properties["bubble_point_pressure"] = sat_pressure * self.ureg.pascal
-            properties["dew_point_pressure"] = sat_pressure * self.ureg.pascal
-        except:
-            properties["bubble_point_pressure"] = None
-            properties["dew_point_pressure"] = None
+        # One exact HEOS PT flash (same values as PropsSI), then every property is read from it
+        state = saturation = _saturation_state(fluid)
+        T_crit, p_crit = _critical_point(fluid)
+        with _STATE_LOCK:
+            state.update(CP.PT_INPUTS, pressure, temperature)
+            density = state.rhomass()
+            specific_heat = state.cpmass()
+            viscosity = state.viscosity()
+            conductivity = state.conductivity()
+            enthalpy = state.hmass()
+            entropy = state.smass()
+            molecular_weight = state.molar_mass()
+
+            # A PT state is single-phase, where surface tension is undefined (PropsSI raises too)
+            surface_tension = None
+
+            # Saturation only exists below the critical point; skip flashes bound to fail
+            vapor_pressure = sat_temperature = sat_pressure = None
+
+            if temperature < T_crit:
+                try:
+                    saturation.update(CP.QT_INPUTS, 1, temperature)
+                    vapor_pressure = saturation.p()
+                except ValueError:
+                    pass
+
+                # Bubble and dew points (for pure fluids, these are the same as saturation properties)
+                try:
+                    saturation.update(CP.QT_INPUTS, 0, temperature)
+                    sat_pressure = saturation.p()
+                except ValueError:
+                    pass
+
+            if pressure < p_crit:
+                try:
+                    saturation.update(CP.PQ_INPUTS, pressure, 0)
+                    sat_temperature = saturation.T()
+                except ValueError:
+                    pass
+
+        values = {
+            "temperature": temperature,
+            "pressure": pressure,
+            "density": density,
+            "specific_heat": specific_heat,
+            "viscosity": viscosity,
+            "conductivity": conductivity,
+            "enthalpy": enthalpy,
+            "entropy": entropy,
+            "molecular_weight": molecular_weight,
+            "surface_tension": surface_tension,
+            "vapor_pressure": vapor_pressure,
+            "bubble_point_temperature": sat_temperature,
+            "dew_point_temperature": sat_temperature,
+            "bubble_point_pressure": sat_pressure,
+            "dew_point_pressure": sat_pressure,
+        }
+        properties = {name: _flat(value, UNITS[name]) for name, value in values.items()}
         
         return properties
     
@@ -90,75 +330,174 @@ class Components:
         
         Returns:
         --------
-        float with units
-            The requested property with appropriate units
+        dict
+            The requested property as {"value", "units"} ("dimensionless" if
+            the property has no mapped unit), or None for unavailable
+            bubble/dew points. Values served by a surrogate (see
+            enable_surrogate) also carry "surrogate": True
         """
-        if fluid not in self.list_all_components():
+        if fluid not in _FLUIDS:
             raise ValueError(f"Fluid '{fluid}' not found")
         
-        # Map of properties to their units
-        units_map = {
-            "D": self.ureg.kg / self.ureg.m**3,           # Density
-            "C": self.ureg.joule / (self.ureg.kg * self.ureg.kelvin),  # Specific heat
-            "V": self.ureg.pascal * self.ureg.second,     # Viscosity
-            "L": self.ureg.watt / (self.ureg.meter * self.ureg.kelvin),  # Conductivity
-            "H": self.ureg.joule / self.ureg.kg,          # Enthalpy
-            "S": self.ureg.joule / (self.ureg.kg * self.ureg.kelvin),  # Entropy
-            "M": self.ureg.kg / self.ureg.mol,           # Molecular weight
-            "I": self.ureg.newton / self.ureg.meter,      # Surface tension
-            "P": self.ureg.pascal,                        # Pressure
-            "T": self.ureg.kelvin,                        # Temperature
-            "T_bubble": self.ureg.kelvin,                 # Bubble point temperature
-            "T_dew": self.ureg.kelvin,                    # Dew point temperature
-            "P_bubble": self.ureg.pascal,                 # Bubble point pressure
-            "P_dew": self.ureg.pascal                     # Dew point pressure
-        }
+        # Approximate in-range lookups; anything else falls through to CoolProp
+        surrogate = _SURROGATES.get((fluid, property_name))
+        if surrogate is not None and surrogate.covers(temperature, pressure):
+            result = _flat(surrogate(temperature, pressure), _KEY_UNITS.get(property_name, "dimensionless"))
+            result["surrogate"] = True
+            return result
         
-        # Check if the fluid is pure (not a mixture)
-        # For bubble and dew points, we need a mixture
-        if property_name in ["T_bubble", "T_dew", "P_bubble", "P_dew"]:
-            # For pure fluids, return the saturation temperature/pressure
+        # Bubble and dew points: for pure fluids, the saturation temperature/pressure
+        saturation = _SATURATION_PROPERTIES.get(property_name)
+        if saturation is not None:
+            output, given = saturation
+            T_crit, p_crit = _critical_point(fluid)
+            given_value, critical_value = (pressure, p_crit) if given == "P" else (temperature, T_crit)
+            
+            # There is no saturation above the critical point, so skip the flash there
+            if given_value >= critical_value:
+                return None
             try:
-                if property_name == "T_bubble" or property_name == "T_dew":
-                    # Saturation temperature at given pressure
-                    value = CP.PropsSI("T", "P", pressure, "Q", 0, fluid)
-                elif property_name == "P_bubble" or property_name == "P_dew":
-                    # Saturation pressure at given temperature
-                    value = CP.PropsSI("P", "T", temperature, "Q", 0, fluid)
-            except Exception as e:
+                value = CP.PropsSI(output, given, given_value, "Q", 0, fluid)
+            except (ValueError, RuntimeError):
                 return None  # Returns None if calculation not possible
         else:
             # For other properties, use standard method
             value = CP.PropsSI(property_name, "T", temperature, "P", pressure, fluid)
         
-        if property_name in units_map:
-            return value * units_map[property_name]
-        else:
-            return value  # Return without units if not in the map
+        return _flat(value, _KEY_UNITS.get(property_name, "dimensionless"))
+    
+    def get_properties(self, fluid, property_names, temperature, pressure):
+        """
+        Returns several properties for a fluid at one temperature and pressure,
+        reading all of them from a single flash instead of one per property
+        
+        Parameters:
+        -----------
+        fluid : str
+            Name of the fluid
+        property_names : list
+            Property keys to retrieve (CoolProp format, bubble/dew keys included)
+        temperature : float
+            Temperature in K
+        pressure : float
+            Pressure in Pa
+        
+        Returns:
+        --------
+        dict
+            Dictionary mapping each key to {"value", "units"}, or None when the
+            property is not available at this state
+        """
+        if fluid not in _FLUIDS:
+            raise ValueError(f"Fluid '{fluid}' not found")
+        
+        # Resolve every key up front so an unknown one fails before the flash
+        indexes = {name: CP.get_parameter_index(name) for name in property_names
+                   if name not in _SATURATION_PROPERTIES}
+        
+        result = {}
+        if indexes:
+            # Same HEOS backend as get_property, so the values match it exactly
+            state = _saturation_state(fluid)
+            with _STATE_LOCK:
+                state.update(CP.PT_INPUTS, pressure, temperature)
+                for name, index in indexes.items():
+                    try:
+                        value = state.keyed_output(index)
+                    except (ValueError, RuntimeError):
+                        value = None
+                    result[name] = _flat(value, _KEY_UNITS.get(name, "dimensionless"))
+        
+        # Bubble/dew points come from their own saturation flash
+        for name in property_names:
+            if name in _SATURATION_PROPERTIES:
+                result[name] = self.get_property(fluid, name, temperature, pressure)
+        
+        return {name: result[name] for name in property_names}
+    
+    def get_properties_batch(self, fluid, temperatures, pressures, properties):
+        """
+        Returns properties for a fluid over many temperature/pressure points
+        
+        Parameters:
+        -----------
+        fluid : str
+            Name of the fluid
+        temperatures : array_like
+            Temperatures in K
+        pressures : array_like
+            Pressures in Pa, same shape as temperatures
+        properties : list
+            Property keys to retrieve (CoolProp format)
+        
+        Returns:
+        --------
+        dict
+            Dictionary mapping each property key to {"value": list, "units"};
+            points where CoolProp fails are returned as None
+        """
+        if fluid not in _FLUIDS:
+            raise ValueError(f"Fluid '{fluid}' not found")
+        
+        T = np.asarray(temperatures, dtype=float)
+        P = np.asarray(pressures, dtype=float)
+        if T.shape != P.shape:
+            raise ValueError(f"Temperatures and pressures must have the same shape, got {T.shape} and {P.shape}")
+        
+        result = {}
+        for prop in properties:
+            CP.get_parameter_index(prop)  # raises ValueError for unknown keys
+            
+            # One vectorized call per property; failed points come back as inf
+            try:
+                values = np.asarray(CP.PropsSI(prop, "T", T.ravel(), "P", P.ravel(), fluid), dtype=float).reshape(T.shape)
+            except ValueError:
+                # Raised when no point at all could be calculated
+                values = np.full(T.shape, np.inf)
+            result[prop] = {
+                "value": np.where(np.isfinite(values), values, None).tolist(),
+                "units": _KEY_UNITS.get(prop, "dimensionless")
+            }
+        
+        return result
+    
+    def enable_surrogate(self, fluid, prop, T_range, P_range, n=500):
+        """
+        Fits an RBF surrogate for one property so that get_property serves
+        in-range lookups from it instead of running a CoolProp flash
+        
+        Intended for tight loops (design sweeps) where an interpolation error
+        of the order of 0.1% is acceptable. The range should stay inside a single
+        phase: properties jump across the saturation line and the fit smears them.
+        
+        Parameters:
+        -----------
+        fluid : str
+            Name of the fluid
+        prop : str
+            Property key to approximate (CoolProp format)
+        T_range : tuple
+            (min, max) temperature in K
+        P_range : tuple
+            (min, max) pressure in Pa
+        n : int, optional
+            Number of CoolProp sample points used for the fit
+        """
+        if fluid not in _FLUIDS:
+            raise ValueError(f"Fluid '{fluid}' not found")
+        if prop in _SATURATION_PROPERTIES:
+            raise ValueError(f"Property '{prop}' cannot be approximated by a surrogate")
+        CP.get_parameter_index(prop)  # raises ValueError for unknown keys
+        
+        _SURROGATES[(fluid, prop)] = _Surrogate(fluid, prop, T_range, P_range, n)
+    
+    def disable_surrogate(self, fluid, prop):
+        """Drops the surrogate for (fluid, prop), if any, so lookups use CoolProp again"""
+        _SURROGATES.pop((fluid, prop), None)
     
     def get_property_names(self):
         """Returns a dictionary of available property keys and their descriptions"""
-        property_map = {
-            "D": "Density [kg/m³]",
-            "C": "Specific heat [J/(kg·K)]",
-            "V": "Viscosity [Pa·s]",
-            "L": "Thermal conductivity [W/(m·K)]",
-            "H": "Enthalpy [J/kg]",
-            "S": "Entropy [J/(kg·K)]",
-            "M": "Molar mass [kg/mol]",
-            "I": "Surface tension [N/m]",
-            "P": "Pressure [Pa]",
-            "T": "Temperature [K]",
-            "Q": "Quality (vapor fraction) [kg/kg]",
-            "U": "Internal energy [J/kg]",
-            "A": "Speed of sound [m/s]",
-            "Z": "Compressibility factor [-]",
-            "T_bubble": "Bubble point temperature [K]",
-            "T_dew": "Dew point temperature [K]",
-            "P_bubble": "Bubble point pressure [Pa]",
-            "P_dew": "Dew point pressure [Pa]"
-        }
-        return property_map
+        return dict(_PROPERTY_NAMES)
     
     def get_critical_properties(self, fluid):
         """
@@ -172,35 +511,44 @@ class Components:
         Returns:
         --------
         dict
-            Dictionary containing critical properties
+            Dictionary mapping each critical/triple point property to {"value", "units"}
         """
-        if fluid not in self.list_all_components():
+        if fluid not in _FLUIDS:
             raise ValueError(f"Fluid '{fluid}' not found")
         
-        critical_props = {}
-        critical_props["critical_temperature"] = CP.PropsSI("Tcrit", fluid) * self.ureg.kelvin
-        critical_props["critical_pressure"] = CP.PropsSI("Pcrit", fluid) * self.ureg.pascal
-        critical_props["critical_density"] = CP.PropsSI("rhocrit", fluid) * self.ureg.kg / self.ureg.m**3
-        critical_props["triple_point_temperature"] = CP.PropsSI("Ttriple", fluid) * self.ureg.kelvin
-        critical_props["triple_point_pressure"] = CP.PropsSI("ptriple", fluid) * self.ureg.pascal
+        # Constants of the equation of state, computed once per fluid
+        values = _critical_constants(fluid)
+        return {name: _flat(value, UNITS[name]) for name, value in zip(_CRITICAL_NAMES, values)}
+    
+    def get_critical_properties_batch(self, fluids):
+        """
+        Returns critical properties for several fluids, one array per property
         
-        return critical_props
+        Parameters:
+        -----------
+        fluids : list
+            Names of the fluids
+        
+        Returns:
+        --------
+        dict
+            Dictionary with the "fluids" list and, for each critical/triple point
+            property, {"value": list, "units"} in the same order as the fluids
+        """
+        missing = [fluid for fluid in fluids if fluid not in _FLUIDS]
+        if missing:
+            raise ValueError(f"Fluid(s) not found: {', '.join(missing)}")
+        
+        values = np.array([_critical_constants(fluid) for fluid in fluids], dtype=float).reshape(-1, len(_CRITICAL_NAMES))
+        result = {"fluids": list(fluids)}
+        for name, column in zip(_CRITICAL_NAMES, values.T):
+            result[name] = {"value": column.tolist(), "units": UNITS[name]}
+        
+        return result
         
     def get_property_mixture_names(self):
         """Returns a dictionary of available property keys for mixtures and their descriptions"""
-        property_map = {
-            "D": "Density [kg/m³]",
-            "C": "Specific heat [J/(kg·K)]",
-            "V": "Viscosity [Pa·s]",
-            "L": "Thermal conductivity [W/(m·K)]",
-            "H": "Enthalpy [J/kg]",
-            "S": "Entropy [J/(kg·K)]",
-            "M": "Molar mass [kg/mol]",
-            "I": "Surface tension [N/m]",
-            "P": "Pressure [Pa]",
-            "T": "Temperature [K]"
-        }
-        return property_map
+        return dict(_PROPERTY_MIXTURE_NAMES)
 
     def get_mixture_properties(self, fluid_fractions, temperature, pressure, properties=None):
         """
@@ -221,72 +569,55 @@ class Components:
         Returns:
         --------
         dict
-            Dictionary containing the requested properties for the mixture
+            Dictionary mapping each requested property to {"value", "units"}
+            (None if it could not be calculated)
         """
         # Validate inputs
-        for fluid in fluid_fractions.keys():
-            if fluid not in self.list_all_components():
-                raise ValueError(f"Fluid '{fluid}' not found")
+        missing = fluid_fractions.keys() - _FLUIDS
+        if missing:
+            raise ValueError(f"Fluid(s) not found: {', '.join(sorted(missing))}")
                 
         # Check that fractions sum to approximately 1
-        total_fraction = sum(fluid_fractions.values())
+        total_fraction = math.fsum(fluid_fractions.values())
         if not 0.99 <= total_fraction <= 1.01:
             raise ValueError(f"Sum of fluid fractions should be 1.0, got {total_fraction}")
             
-        # Create the mixture string for CoolProp
-        # Format: "HEOS::fluid1[fraction1]&fluid2[fraction2]&..."
-        mixture_string = "HEOS::"
-        for i, (fluid, fraction) in enumerate(fluid_fractions.items()):
-            if i > 0:
-                mixture_string += "&"
-            mixture_string += f"{fluid}[{fraction}]"
+        # The mixture state (and its mixing rules) is built once per composition
+        state = _mixture_state(tuple(sorted(fluid_fractions.items())))
             
         # Get properties
         result = {}
         
         # Define which properties to retrieve
         if properties is None:
-            properties = ["D", "C", "V", "L", "H", "S", "M", "I", "P", "T"]
-            
-        # Map of property keys to result dictionary keys
-        property_key_map = {
-            "D": "density",
-            "C": "specific_heat",
-            "V": "viscosity",
-            "L": "thermal_conductivity",
-            "H": "enthalpy",
-            "S": "entropy",
-            "M": "molecular_weight",
-            "I": "surface_tension",
-            "P": "pressure",
-            "T": "temperature"
-        }
-            
-        # Map of properties to their units (same as in get_property method)
-        units_map = {
-            "D": self.ureg.kg / self.ureg.m**3,           # Density
-            "C": self.ureg.joule / (self.ureg.kg * self.ureg.kelvin),  # Specific heat
-            "V": self.ureg.pascal * self.ureg.second,     # Viscosity
-            "L": self.ureg.watt / (self.ureg.meter * self.ureg.kelvin),  # Conductivity
-            "H": self.ureg.joule / self.ureg.kg,          # Enthalpy
-            "S": self.ureg.joule / (self.ureg.kg * self.ureg.kelvin),  # Entropy
-            "M": self.ureg.kg / self.ureg.mol,           # Molecular weight
-            "I": self.ureg.newton / self.ureg.meter,      # Surface tension
-            "P": self.ureg.pascal,                        # Pressure
-            "T": self.ureg.kelvin                         # Temperature
-        }
+            properties = _MIXTURE_DEFAULT_PROPERTIES
         
-        # Retrieve each property
-        for prop in properties:
+        # Inputs are echoed back as given rather than re-read from the flash
+        inputs = {"T": temperature, "P": pressure}
+        
+        with _STATE_LOCK:
+            # One PT flash; if it fails no property can be calculated
             try:
-                # For mixtures or other properties
-                value = CP.PropsSI(prop, "T", temperature, "P", pressure, mixture_string)
-                
-                if prop in units_map:
-                    result[property_key_map.get(prop, prop)] = value * units_map[prop]
-                else:
-                    result[property_key_map.get(prop, prop)] = value
-            except Exception as e:
-                result[property_key_map.get(prop, prop)] = None
+                state.update(CP.PT_INPUTS, pressure, temperature)
+            except (ValueError, RuntimeError):
+                return {_PROPERTY_KEY_MAP.get(prop, prop): None for prop in properties}
+            
+            # Skip the outputs known to fail for this phase instead of raising for them
+            unavailable = _MIXTURE_UNAVAILABLE_BY_PHASE.get(state.phase(), _MIXTURE_UNAVAILABLE)
+            
+            # Retrieve each property from the flashed state
+            for prop in properties:
+                if prop in unavailable:
+                    result[_PROPERTY_KEY_MAP.get(prop, prop)] = None
+                    continue
+                try:
+                    if prop in inputs:
+                        value = inputs[prop]
+                    else:
+                        value = state.keyed_output(CP.get_parameter_index(prop))
+                    
+                    result[_PROPERTY_KEY_MAP.get(prop, prop)] = _flat(value, _KEY_UNITS.get(prop, "dimensionless"))
+                except (ValueError, RuntimeError):
+                    result[_PROPERTY_KEY_MAP.get(prop, prop)] = None
                 
         return result 
\ No newline at end of file
@@ -1,15 +1,167 @@
+import bisect
+import math
 import numpy as np
 
+from functools import lru_cache
+
 from pint import UnitRegistry
 
 from typing import Dict, List
 
-from scipy.optimize import fsolve
+from scipy.special import wrightomega
 
 from .piping import Piping
 
 from base_validator import BaseValidator
 
+G = 9.80665          # gravity (m/s²)
+KGF_CM2_TO_PA = 98066.5
+_TWO_OVER_LN10 = 2 / math.log(10)  # turns ln into the 2·log10 of Colebrook
+
+
+@lru_cache(maxsize=None)
+def _piping() -> Piping:
+    """Shared Piping tables (read-only), built on first use."""
+    return Piping()
+
+
+@lru_cache(maxsize=None)
+def _fitting_leq(fitting: str) -> float:
+    """Equivalent length of a fitting, in pipe diameters (L/D)."""
+    spec = _piping().fitting_specifications(fitting)
+    return float(spec["specifications"]["equivalentLength"].magnitude)
+
+
+def _colebrook_white(eps_over_D, Re):
+    """
+    Darcy friction factor from 1/√f = -2·log10(a + b/√f), a = ε/(3.71·D), b = 2.51/Re.
+
+    Exact solution via Lambert W: 1/√f = c·W(exp(L)) - a/b, with c = 2/ln 10 and
+    L = a/(b·c) - ln(b·c); Wright ω(L) = W(exp(L)) without overflowing exp(L)
+    for rough pipes. The subtraction cancels digits when a/b is large (rough
+    pipes, very high Re), so two Newton steps on x = 1/√f with the analytic
+    derivative restore full precision. Scalars and arrays alike.
+    """
+    a = eps_over_D / 3.71
+    b = 2.51 / Re
+    c = _TWO_OVER_LN10
+    log = np.log
+    x = c * wrightomega(a / (b * c) - log(b * c)).real - a / b
+    for _ in range(2):
+        y = a + b * x
+        x = x - (x + c * log(y)) / (1 + c * b / y)
+    return 1 / (x * x)
+
+
+def _swamee_jain(eps_over_D, Re):
+    return 0.25 / (
+        np.log10(eps_over_D / 3.7 + 5.74 / (Re**0.9))
+    ) ** 2
+
+
+def _haaland(eps_over_D, Re):
+    inv_sqrt_f = -1.8 * np.log10(
+        (eps_over_D / 3.7) ** 1.11 + 6.9 / Re
+    )
+    return 1 / inv_sqrt_f**2
+
+
+def _serghides(eps_over_D, Re):
+    # Steffensen-accelerated fixed point of Colebrook; explicit, <0.01% error
+    r = eps_over_D / 3.71  # same constants as _colebrook_white
+    A = -2 * np.log10(r + 12 / Re)
+    B = -2 * np.log10(r + 2.51 * A / Re)
+    C = -2 * np.log10(r + 2.51 * B / Re)
+    inv_sqrt_f = A - (B - A) ** 2 / (C - 2 * B + A)
+    return 1 / inv_sqrt_f**2
+
+
+# Darcy friction factor correlations; each takes scalars or arrays
+_FRICTION_METHODS = {
+    "ColebrookWhite": _colebrook_white,
+    "SwameeJain": _swamee_jain,
+    "Haaland": _haaland,
+    "Serghides": _serghides,
+}
+
+
+@lru_cache(maxsize=4096)
+def _friction_factor_cached(method: str, eps_over_D: float, Re: float) -> float:
+    return float(_FRICTION_METHODS[method](eps_over_D, Re))
+
+
+@lru_cache(maxsize=32)
+def _sorted_diameters(schedule: str) -> tuple:
+    """Nominal diameters (mm) available in a schedule, ascending."""
+    return tuple(np.sort(_piping().diameters_array(schedule)["nominal"]).tolist())
+
+
+# ---------------------------------------------------------------------- #
+#              Hydraulic diameter (4·Area/Perimeter) by shape, mm          #
+# ---------------------------------------------------------------------- #
+def _dh_circular(diameter: float) -> float:
+    return diameter
+
+
+def _dh_rectangular(width: float, height: float) -> float:
+    area = width * height
+    perimeter = 2 * (width + height)
+    return 4 * area / perimeter
+
+
+def _dh_annular(outer_diameter: float, inner_diameter: float) -> float:
+    if inner_diameter >= outer_diameter:
+        raise ValueError("Inner diameter must be smaller than outer diameter")
+    return outer_diameter - inner_diameter
+
+
+def _dh_triangular(a: float, b: float, c: float) -> float:
+    a, b, c = sorted((a, b, c), reverse=True)
+
+    # Check triangle inequality (with a ≥ b ≥ c only b + c > a can fail)
+    if c - (a - b) <= 0:
+        raise ValueError("Invalid triangle: sides do not satisfy triangle inequality")
+
+    # Area (Kahan's rearrangement of Heron's formula, accurate for needle-like triangles)
+    area = 0.25 * math.sqrt((a + (b + c)) * (c - (a - b)) * (c + (a - b)) * (a + (b - c)))
+
+    # Perimeter
+    perimeter = a + b + c
+
+    return 4 * area / perimeter
+
+
+def _dh_circular_cap(D: float, H: float) -> float:
+    # Check if height is less than diameter
+    if H > D:
+        raise ValueError("Height cannot be greater than diameter")
+
+    if H <= 0:
+        raise ValueError("Height must be greater than 0")
+
+    R = D / 2
+
+    # Segment of half-angle θ: the arc 2Rθ and the chord 2c (c = half chord)
+    # bound an area R²θ - (R-H)c
+    # (the height checks above keep acos and sqrt inside their domains)
+    theta = math.acos((R - H) / R)
+    half_chord = math.sqrt(H * (D - H))
+    P = 2 * R * theta + 2 * half_chord
+    A = R * R * theta - (R - H) * half_chord
+
+    return 4 * A / P
+
+
+# shape -> (required parameters, handler taking them in order)
+_SHAPES = {
+    "circular": (["diameter"], _dh_circular),
+    "rectangular": (["width", "height"], _dh_rectangular),
+    "annular": (["outer_diameter", "inner_diameter"], _dh_annular),
+    "triangular": (["side_a", "side_b", "side_c"], _dh_triangular),
+    "circularCap": (["diameter", "height"], _dh_circular_cap),
+}
+
+
 class Hydraulic(BaseValidator):
     """Hydraulic utility class"""
 
@@ -18,24 +170,53 @@ class Hydraulic(BaseValidator):
     # ------------------------------------------------------------------ #
     def __init__(self) -> None:
         self.ureg = UnitRegistry()
-        self.g = 9.80665 * self.ureg.m / self.ureg.s ** 2  # gravity
+        self.g = G * self.ureg.m / self.ureg.s ** 2  # gravity
+
+        # Units bound once; results are built with Quantity(value, unit),
+        # which skips the parser and the multiplication dispatch
+        self._Q = self.ureg.Quantity
+        self._m = self.ureg.m
+        self._mm = self.ureg.mm
+        self._dimensionless = self.ureg.dimensionless
 
     # ------------------------------------------------------------------ #
     #                         PRIVATE HELPERS                            #
     # ------------------------------------------------------------------ #
     def _equivalent_length(
-        self, fittings: List[Dict[str, object]] | None, diameter_m: "pint.Quantity"
-    ) -> "pint.Quantity":
-        """Return the total equivalent length of all fittings."""
+        self, fittings: List[Dict[str, object]] | None, diameter_m: float
+    ) -> float:
+        """Return the total equivalent length of all fittings (m)."""
         if not fittings:
-            return 0 * self.ureg.m
+            return 0.0
 
-        piping = Piping()
-        total = 0 * self.ureg.m
-        for f in fittings:
-            spec = piping.fitting_specifications(f["fitting"])
-            total += spec["specifications"]["equivalentLength"].magnitude * diameter_m * f["quantity"]
-        return total
+        return sum(_fitting_leq(f["fitting"]) * f["quantity"] for f in fittings) * diameter_m
+
+    # ------------------------------------------------------------------ #
+    #                  FLOAT KERNELS (SI units, no pint)                 #
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def _darcy_weisbach(f: float, L: float, Leq: float, V: float, D_m: float) -> float:
+        """Darcy-Weisbach head loss (m)."""
+        return f * (L + Leq) * V * V / (2 * G * D_m)
+
+    @staticmethod
+    def _hazen_williams(Q: float, C: float, L: float, Leq: float, D_m: float) -> float:
+        """Hazen-Williams head loss (m); Q in m³/s."""
+        return 10.67 * (L + Leq) * math.pow(Q, 1.85) / (math.pow(C, 1.85) * math.pow(D_m, 4.87))
+
+    @staticmethod
+    def _npsh_available(
+        Ps: float, Patm: float, Pv: float, rho: float, hf: float, V: float, h: float
+    ) -> float:
+        """Available NPSH (m); pressures in Pa."""
+        return (Ps + Patm - Pv) / (rho * G) + h + V * V / (2 * G) - hf
+
+    @staticmethod
+    def _head(
+        p1: float, p2: float, z1: float, z2: float, v1: float, v2: float, rho: float, hf: float
+    ) -> float:
+        """Manometric head between two points (m); pressures in Pa."""
+        return (p2 - p1) / (rho * G) + (z2 - z1) + (v2**2 - v1**2) / (2 * G) + hf
 
     # ------------------------------------------------------------------ #
     #                              PUBLIC                                #
@@ -82,18 +263,20 @@ class Hydraulic(BaseValidator):
             self._require_keys(parameters, req)
             self._validate_numeric(parameters, req)
 
-            f = parameters["friction_factor"]
-            L = parameters["pipe_length"] * self.ureg.m
-            V = parameters["velocity"] * self.ureg.m / self.ureg.s
-            D = parameters["diameter"] * self.ureg.mm
-            D_m = D.to(self.ureg.m)
+            D_m = parameters["diameter"] * 1e-3
+            fittings = parameters.get("fittings")
+            Leq = self._equivalent_length(fittings, D_m) if fittings else 0.0
 
-            Leq = self._equivalent_length(parameters.get("fittings"), D_m)
- 
-            hl = f * (L + Leq) * V**2 / (2 * D_m * self.g)
+            hl = self._darcy_weisbach(
+                parameters["friction_factor"],
+                parameters["pipe_length"],
+                Leq,
+                parameters["velocity"],
+                D_m,
+            )
             if hl < 0:
-                raise ValueError(f"Head loss cannot be negative, got {hl}.")
-            return hl.to(self.ureg.m)
+                raise ValueError(f"Head loss cannot be negative, got {hl} meter.")
+            return self._Q(hl, self._m)
 
         # ----------------------- Hazen-Williams ------------------------ #
         if method == "Hazen-Williams":
@@ -101,23 +284,25 @@ class Hydraulic(BaseValidator):
             self._require_keys(parameters, req)
             self._validate_numeric(parameters, req)
 
-            Q = parameters["flow_rate"] * self.ureg.m**3 / self.ureg.s
-            C = parameters["roughness_coefficient"]
-            L = parameters["pipe_length"] * self.ureg.m
-            D = parameters["diameter"] * self.ureg.mm
-
-            if D.magnitude < 50:
+            if parameters["diameter"] < 50:
                 raise ValueError("For Hazen-Williams the diameter must exceed 50 mm.")
-
-            D_m = D.to(self.ureg.m)
-            Leq = self._equivalent_length(parameters.get("fittings"), D_m)
-
-            hl = (
-                10.67 * (L + Leq) * Q**1.85 / (C**1.85 * D_m**4.87)
-            ) * self.ureg.s**1.85 / self.ureg.m**0.68
+            if parameters["flow_rate"] < 0:
+                raise ValueError(f"Flow rate cannot be negative, got {parameters['flow_rate']} m³/s.")
+
+            D_m = parameters["diameter"] * 1e-3
+            fittings = parameters.get("fittings")
+            Leq = self._equivalent_length(fittings, D_m) if fittings else 0.0
+
+            hl = self._hazen_williams(
+                parameters["flow_rate"],
+                parameters["roughness_coefficient"],
+                parameters["pipe_length"],
+                Leq,
+                D_m,
+            )
             if hl <= 0:
-                raise ValueError(f"Head loss must be positive, got {hl}.")
-            return hl
+                raise ValueError(f"Head loss must be positive, got {hl} meter.")
+            return self._Q(hl, self._m)
 
         raise ValueError('Invalid method. Use "Darcy-Weisbach" or "Hazen-Williams".')
 
@@ -142,42 +327,47 @@ class Hydraulic(BaseValidator):
             {"characteristic_diameter": <mm>,
              "velocity": <m/s>,
              "kinematic_viscosity": <m²/s>}
+
+        Any of the values may be a NumPy array (broadcast together); the
+        result is then a plain float64 array instead of a pint.Quantity.
         """
         mode1 = ["characteristic_diameter", "velocity", "density", "dynamic_viscosity"]
         mode2 = ["characteristic_diameter", "velocity", "kinematic_viscosity"]
 
-        # ------------- dynamic viscosity supplied ------------- #
         if all(k in parameters for k in mode1):
-            self._validate_numeric(parameters, mode1)
-
-            D = parameters["characteristic_diameter"] * self.ureg.mm
-            V = parameters["velocity"] * self.ureg.m / self.ureg.s
-            rho = parameters["density"] * self.ureg.kg / self.ureg.m**3
-            mu = parameters["dynamic_viscosity"] * self.ureg.kg / (
-                self.ureg.m * self.ureg.s
+            keys = mode1
+        elif all(k in parameters for k in mode2):
+            keys = mode2
+        else:
+            raise ValueError(
+                "Invalid parameters: provide either (D, V, ρ, μ) or (D, V, ν)."
             )
 
-            Re = (D * rho * V / mu).to_base_units()
-            if Re <= 0:
-                raise ValueError(f"Reynolds number must be positive, got {Re}.")
-            return Re
+        vectorized = any(isinstance(parameters[k], np.ndarray) for k in keys)
+        if vectorized:
+            values = [np.asarray(parameters[k], dtype=float) for k in keys]
+        else:
+            self._validate_numeric(parameters, keys)
+            values = [parameters[k] for k in keys]
 
-        # ------------- kinematic viscosity supplied ------------ #
-        if all(k in parameters for k in mode2):
-            self._validate_numeric(parameters, mode2)
+        # ------------- dynamic viscosity supplied ------------- #
+        if keys is mode1:
+            D, V, rho, mu = values
+            Re = D * 1e-3 * rho * V / mu
 
-            D = parameters["characteristic_diameter"] * self.ureg.mm
-            V = parameters["velocity"] * self.ureg.m / self.ureg.s
-            nu = parameters["kinematic_viscosity"] * self.ureg.m**2 / self.ureg.s
+        # ------------- kinematic viscosity supplied ------------ #
+        else:
+            D, V, nu = values
+            Re = D * 1e-3 * V / nu
 
-            Re = (D * V / nu).to_base_units()
-            if Re <= 0:
-                raise ValueError(f"Reynolds number must be positive, got {Re}.")
+        if vectorized:
+            if np.any(Re <= 0):
+                raise ValueError("Reynolds numbers must be positive.")
             return Re
 
-        raise ValueError(
-            "Invalid parameters: provide either (D, V, ρ, μ) or (D, V, ν)."
-        )
+        if Re <= 0:
+            raise ValueError(f"Reynolds number must be positive, got {Re} dimensionless.")
+        return self._Q(Re, self._dimensionless)
 
     # endregion reynolds
 
@@ -189,57 +379,49 @@ class Hydraulic(BaseValidator):
         Parameters
         ----------
         parameters : dict
-            ``{"method": "ColebrookWhite" | "SwameeJain" | "Haaland",
+            ``{"method": "ColebrookWhite" | "SwameeJain" | "Haaland" | "Serghides",
                "roughness": <mm>,
                "diameter": <mm>,
                "reynolds": <float>}``
 
+            Roughness, diameter and Reynolds may also be NumPy arrays
+            (broadcast together) to evaluate many pipes in one call.
+
         Returns
         -------
-        pint.Quantity
-            Darcy friction factor (dimensionless).
+        pint.Quantity | np.ndarray
+            Darcy friction factor (dimensionless); a plain array for array inputs.
         """
         if "method" not in parameters:
-            return ["ColebrookWhite", "SwameeJain", "Haaland"]
+            return list(_FRICTION_METHODS)
 
         req = ["roughness", "diameter", "reynolds", "method"]
         self._require_keys(parameters, req)
-        self._validate_numeric(parameters, ["roughness", "diameter", "reynolds"])
 
-        eps = parameters["roughness"]
-        D = parameters["diameter"]
-        Re = float(parameters["reynolds"])
+        numeric = ["roughness", "diameter", "reynolds"]
+        vectorized = any(isinstance(parameters[k], np.ndarray) for k in numeric)
+        if vectorized:
+            eps, D, Re = np.broadcast_arrays(
+                *(np.asarray(parameters[k], dtype=float) for k in numeric)
+            )
+        else:
+            self._validate_numeric(parameters, numeric)
+            eps = parameters["roughness"]
+            D = parameters["diameter"]
+            Re = float(parameters["reynolds"])
         eps_over_D = eps / D  # dimensionless ratio
 
         method = parameters["method"]
+        if method not in _FRICTION_METHODS:
+            raise ValueError("Invalid friction factor method.")
 
-        # ------------------------- Colebrook-White ---------------------- #
-        if method == "ColebrookWhite":
-
-            def colebrook(f):
-                return 1 / np.sqrt(f) + 2 * np.log10(
-                    eps_over_D / 3.71 + 2.51 / (Re * np.sqrt(f))
-                )
+        if vectorized:
+            return _FRICTION_METHODS[method](eps_over_D, Re)
 
-            f_solution, = fsolve(colebrook, 0.02)
-            return float(f_solution) * self.ureg.dimensionless
-
-        # --------------------------- Swamee-Jain ------------------------ #
-        if method == "SwameeJain":
-            f = 0.25 / (
-                np.log10(eps_over_D / 3.7 + 5.74 / (Re**0.9))
-            ) ** 2
-            return float(f) * self.ureg.dimensionless
-
-        # ----------------------------- Haaland -------------------------- #
-        if method == "Haaland":
-            inv_sqrt_f = -1.8 * np.log10(
-                (eps_over_D / 3.7) ** 1.11 + 6.9 / Re
-            )
-            f = 1 / inv_sqrt_f**2
-            return float(f) * self.ureg.dimensionless
-
-        raise ValueError("Invalid friction factor method.")
+        # Quantized to 6 significant digits so near-identical calls from
+        # iterative network solvers hit the cache
+        f = _friction_factor_cached(method, float(f"{eps_over_D:.6g}"), float(f"{Re:.6g}"))
+        return self._Q(f, self._dimensionless)
 
     # endregion friction_factor
 
@@ -265,14 +447,14 @@ class Hydraulic(BaseValidator):
         d_calc = parameters["calculated_diameter"]
         schedule = parameters["schedule"]
 
-        diameters = sorted(Piping().diameters(schedule))
-        for dn in diameters:
-            if dn > d_calc:
-                return dn * self.ureg.mm
+        diameters = _sorted_diameters(schedule)
+        i = bisect.bisect_right(diameters, d_calc)
+        if i == len(diameters):
+            raise ValueError(
+                f"No diameter in schedule '{schedule}' exceeds {d_calc} mm."
+            )
 
-        raise ValueError(
-            f"No diameter in schedule '{schedule}' exceeds {d_calc} mm."
-        )
+        return self._Q(diameters[i], self._mm)
 
     # endregion get_real_diameter
 
@@ -295,17 +477,15 @@ class Hydraulic(BaseValidator):
         self._require_keys(parameters, req)
         self._validate_numeric(parameters, req)
 
-        Q = parameters["flow_rate"] * self.ureg.m**3 / self.ureg.s
-        V = parameters["velocity"] * self.ureg.m / self.ureg.s
+        Q = parameters["flow_rate"]
+        V = parameters["velocity"]
 
-        # Use **0.5 instead of math.sqrt to keep units intact
-        D = (4 * Q / (np.pi * V)) ** 0.5
-        D_mm = D.to(self.ureg.mm)
+        D_mm = (4 * Q / (np.pi * V)) ** 0.5 * 1e3
 
-        if D_mm <= 0 * self.ureg.mm:
-            raise ValueError(f"Diameter must be positive, got {D_mm}.")
+        if D_mm <= 0:
+            raise ValueError(f"Diameter must be positive, got {D_mm} millimeter.")
 
-        return D_mm
+        return self._Q(D_mm, self._mm)
 
     # endregion get_calculated_diameter
 
@@ -325,6 +505,8 @@ class Hydraulic(BaseValidator):
                "pump_inlet_velocity": <m/s>,
                "gauge_elevation": <m>}``
 
+            ``friction_factor`` is the suction-line head loss, already in metres.
+
         Returns
         -------
         pint.Quantity
@@ -336,37 +518,30 @@ class Hydraulic(BaseValidator):
             "vapor_pressure", 
             "specific_mass",
             "friction_factor",
-            "pump_inlet_velocity"
+            "pump_inlet_velocity",
+            "gauge_elevation"
         ]
         self._require_keys(parameters, req)
         self._validate_numeric(parameters, req)
 
-        # Get parameters with proper units
-        Ps = parameters["manometric_pressure"] * self.ureg.kgf / self.ureg.cm**2
-        Patm = parameters["atmospheric_pressure"] * self.ureg.kgf / self.ureg.cm**2
-        Pv = parameters["vapor_pressure"] * self.ureg.kgf / self.ureg.cm**2
-        specific_mass = parameters["specific_mass"] * self.ureg.kg / self.ureg.m**3
-        friction_factor = parameters["friction_factor"] * self.ureg.m
-        pump_inlet_velocity = parameters["pump_inlet_velocity"] * self.ureg.m / self.ureg.s
-        height_term = parameters["gauge_elevation"] * self.ureg.m
-        
-        # Convert pressures
-        # Convert to N/m²
-        Ps_Pa = Ps.to(self.ureg.kgf / self.ureg.cm**2).to(self.ureg.Pa)
-        Patm_Pa = Patm.to(self.ureg.kgf / self.ureg.cm**2).to(self.ureg.Pa)
-        Pv_Pa = Pv.to(self.ureg.kgf / self.ureg.cm**2).to(self.ureg.Pa)
-        
-        # Equation terms
-        pressure_term = (Ps_Pa + Patm_Pa) / (specific_mass * self.g)
-        vapor_pressure_term = Pv_Pa / (specific_mass * self.g)
-        velocity_term = (pump_inlet_velocity**2) / (2 * self.g)
-        
-        
-        # New equation: (Pmanometric+Patm)/gamma + V²/(2g) + h - friction_factor - Pvap/gamma
-        npsh = pressure_term + height_term + velocity_term - friction_factor - vapor_pressure_term
-        
+        # kgf/cm² -> Pa
+        Ps_Pa = parameters["manometric_pressure"] * KGF_CM2_TO_PA
+        Patm_Pa = parameters["atmospheric_pressure"] * KGF_CM2_TO_PA
+        Pv_Pa = parameters["vapor_pressure"] * KGF_CM2_TO_PA
+
+        # (Pmanometric+Patm)/gamma + V²/(2g) + h - friction_factor - Pvap/gamma
+        npsh = self._npsh_available(
+            Ps_Pa,
+            Patm_Pa,
+            Pv_Pa,
+            parameters["specific_mass"],
+            parameters["friction_factor"],
+            parameters["pump_inlet_velocity"],
+            parameters["gauge_elevation"],
+        )
+
         # Return in meters
-        return npsh.to(self.ureg.m)
+        return self._Q(npsh, self._m)
     
     # endregion npsh_available
 
@@ -405,26 +580,11 @@ class Hydraulic(BaseValidator):
         self._require_keys(parameters, req)
         self._validate_numeric(parameters, req)
         
-        # Get parameters with proper units
-        p1 = parameters["pressure1"] * self.ureg.Pa
-        p2 = parameters["pressure2"] * self.ureg.Pa
-        z1 = parameters["elevation1"] * self.ureg.m
-        z2 = parameters["elevation2"] * self.ureg.m
-        v1 = parameters["velocity1"] * self.ureg.m / self.ureg.s
-        v2 = parameters["velocity2"] * self.ureg.m / self.ureg.s
-        specific_mass = parameters["specific_mass"] * self.ureg.kg / self.ureg.m**3
-        friction_factor = parameters["friction_factor"] * self.ureg.m
-        
-        # Equation terms
-        pressure_term = (p2 - p1) / (specific_mass * self.g)
-        elevation_term = (z2 - z1)
-        velocity_term = (v2**2 - v1**2) / (2 * self.g)
-        
         # Head calculation: (p2-p1)/specific_mass*g + (z2-z1) + (v2-v1)/(2g) + friction_factor
-        head = pressure_term + elevation_term + velocity_term + friction_factor
-        
+        head = self._head(*(parameters[k] for k in req))
+
         # Return in meters
-        return head.to(self.ureg.m)
+        return self._Q(head, self._m)
     
     # endregion head
 
@@ -470,108 +630,16 @@ class Hydraulic(BaseValidator):
             Hydraulic diameter (mm).
         """
         if "shape" not in parameters:
-            return ["circular", "rectangular", "annular", "triangular", "circularCap"]
+            return list(_SHAPES)
         
         shape = parameters["shape"]
+        if shape not in _SHAPES:
+            raise ValueError("Invalid shape. Use 'circular', 'rectangular', 'annular', 'triangular', or 'circularCap'.")
         
-        # ----------------------- Circular ------------------------ #
-        if shape == "circular":
-            self._require_keys(parameters, ["diameter"])
-            self._validate_numeric(parameters, ["diameter"])
-            
-            D = parameters["diameter"] * self.ureg.mm
-            return D
-        
-        # ----------------------- Rectangular ------------------------ #
-        elif shape == "rectangular":
-            self._require_keys(parameters, ["width", "height"])
-            self._validate_numeric(parameters, ["width", "height"])
-            
-            width = parameters["width"] * self.ureg.mm
-            height = parameters["height"] * self.ureg.mm
-            
-            # Hydraulic diameter formula: 4*Area/Perimeter
-            area = width * height
-            perimeter = 2 * (width + height)
-            
-            D_h = 4 * area / perimeter
-            return D_h
-        
-        # ----------------------- Annular ------------------------ #
-        elif shape == "annular":
-            self._require_keys(parameters, ["outer_diameter", "inner_diameter"])
-            self._validate_numeric(parameters, ["outer_diameter", "inner_diameter"])
-            
-            D_o = parameters["outer_diameter"] * self.ureg.mm
-            D_i = parameters["inner_diameter"] * self.ureg.mm
-            
-            if D_i >= D_o:
-                raise ValueError("Inner diameter must be smaller than outer diameter")
-            
-            # Hydraulic diameter formula for annular: D_o - D_i
-            D_h = D_o - D_i
-            return D_h
-        
-        # ----------------------- Triangular ------------------------ #
-        elif shape == "triangular":
-            self._require_keys(parameters, ["side_a", "side_b", "side_c"])
-            self._validate_numeric(parameters, ["side_a", "side_b", "side_c"])
-            
-            a = parameters["side_a"] * self.ureg.mm
-            b = parameters["side_b"] * self.ureg.mm
-            c = parameters["side_c"] * self.ureg.mm
-            
-            # Check triangle inequality
-            if a + b <= c or a + c <= b or b + c <= a:
-                raise ValueError("Invalid triangle: sides do not satisfy triangle inequality")
-            
-            # Semi-perimeter
-            s = (a + b + c) / 2
-            
-            # Area (Heron's formula)
-            area = (s * (s - a) * (s - b) * (s - c)) ** 0.5
-            
-            # Perimeter
-            perimeter = a + b + c
-            
-            # Hydraulic diameter formula: 4*Area/Perimeter
-            D_h = 4 * area / perimeter
-            return D_h
+        keys, handler = _SHAPES[shape]
+        self._require_keys(parameters, keys)
+        self._validate_numeric(parameters, keys)
         
-        # ----------------------- Circular Cap ------------------------ #
-        elif shape == "circularCap":
-            self._require_keys(parameters, ["diameter", "height"])
-            self._validate_numeric(parameters, ["diameter", "height"])
-            
-            # Check if height is less than diameter
-            if parameters["height"] > parameters["diameter"]:
-                raise ValueError("Height cannot be greater than diameter")
-            
-            if parameters["height"] <= 0:
-                raise ValueError("Height must be greater than 0")
-                
-            D = parameters["diameter"]
-            H = parameters["height"]
-            
-            R = D / 2
-            
-            # Validate that R-H is not less than -R (arccos domain)
-            if (R-H)/R < -1:
-                raise ValueError("Invalid height/diameter ratio")
-                
-            # Validate that 2*R*H-H^2 is not negative (for sqrt)
-            if (2*R*H - H**2) < 0:
-                raise ValueError("Invalid height/diameter combination")
-            
-            P = (2*np.arccos((R-H)/R)) + (2*np.sqrt((2*R*H)-(H**2)))
-            
-            A = (R**2 * np.arccos((R-H)/R))- ((R-H)*np.sqrt(2*R*H-(H**2)))
-            
-            D_h = 4 * A / P * self.ureg.dimensionless
-            
-            return D_h
-
-        else:
-            raise ValueError("Invalid shape. Use 'circular', 'rectangular', 'annular', 'triangular', or 'circularCap'.")
+        return self._Q(handler(*(parameters[k] for k in keys)), self._mm)
     
     # endregion hydraulic_diameter
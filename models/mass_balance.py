@@ -1,9 +1,65 @@
-import matplotlib
-matplotlib.use('Agg')  # Set non-interactive backend before importing pyplot
-import matplotlib.pyplot as plt
+import threading
+from fractions import Fraction
+import numpy as np
 import sympy as sp
+from scipy.linalg import qr
+from scipy.sparse import csr_matrix
+from scipy.sparse.linalg import splu
+from sympy.solvers.solveset import NonlinearError
 from collections import OrderedDict
 
+# Solutions of recently solved models, keyed by MassBalance._signature(), so
+# the same flowsheet posted to several endpoints is solved only once
+_SOLUTION_CACHE = OrderedDict()
+_SOLUTION_CACHE_SIZE = 128
+_SOLUTION_CACHE_LOCK = threading.Lock()
+
+# ----------------------------------------------------------------------
+# 0) Numeric checks ----------------------------------------------------
+def _first_violation(flows, fractions):
+    """
+    Find the first failed check over flows (S,) and fractions (S, C)
+    with whole-array comparisons; indices are only located on failure.
+
+    Returns (kind, stream_index, component_index) with kind 0 = valid,
+    1 = negative flow, 2 = negative fraction, 3 = fractions not summing to ~1.
+    """
+    negative_flow = flows < 0
+    if negative_flow.any():
+        return 1, int(np.argmax(negative_flow)), -1
+
+    # streams are checked in order; within one, negative fractions come first
+    negative = fractions < 0
+    sums = fractions.sum(axis=1)
+    bad = negative.any(axis=1) | ~((sums >= 0.99) & (sums <= 1.01))
+    if bad.any():
+        i = int(np.argmax(bad))
+        if negative[i].any():
+            return 2, i, int(np.argmax(negative[i]))
+        return 3, i, -1
+    return 0, -1, -1
+
+
+def _exact_values(x, max_denominator=10**6, rtol=1e-12):
+    """
+    SymPy numbers for a float solution: values within round-off of a simple
+    fraction (50.00000000000001, 0.7499999999999999) become that Rational,
+    the rest stay Floats, so results match the exact symbolic solve.
+    """
+    values = []
+    for v in x:
+        q = Fraction(v).limit_denominator(max_denominator)
+        if abs(q - Fraction(v)) <= rtol * max(1.0, abs(v)):
+            values.append(sp.Rational(q.numerator, q.denominator))
+        else:
+            values.append(sp.Float(v))
+    return values
+
+
+def _sparse_lu_solve(A, b):
+    """Solve a square sparse system by sparse LU (raises RuntimeError if singular)"""
+    return splu(A.tocsc()).solve(b)
+
 # ----------------------------------------------------------------------
 # 1) Streams ----------------------------------------------------------
 class Stream:
@@ -28,15 +84,38 @@ class Stream:
         """
         self.name = name
         self.dir = direction  # +1 input; −1 output
-        self.F = sp.symbols(f"F_{name}") if flow_rate is None else float(flow_rate)
+        # given values are stored as sp.Float once, so the equations built
+        # from them do not re-sympify Python floats
+        self.F = sp.symbols(f"F_{name}") if flow_rate is None else sp.Float(flow_rate)
 
         self.z = OrderedDict()
         for c in components:
             if compositions and c in compositions and compositions[c] is not None:
-                self.z[c] = float(compositions[c])
+                self.z[c] = sp.Float(compositions[c])
             else:
                 self.z[c] = sp.symbols(f"z_{name}_{c}")
 
+        # Component flows M = F·z; a symbol wherever z is unknown, so that
+        # every balance stays linear (z is recovered as M/F after solving)
+        self.M = OrderedDict()
+        for c, z in self.z.items():
+            self.M[c] = sp.symbols(f"M_{name}_{c}") if isinstance(z, sp.Symbol) else z * self.F
+        # Σz = 1 is substituted rather than solved: the last unknown component
+        # flow is whatever the others leave of F
+        unknown = [c for c, z in self.z.items() if isinstance(z, sp.Symbol)]
+        if unknown:
+            pivot = unknown[-1]
+            self.M[pivot] = self.F - sp.Add(*[m for c, m in self.M.items() if c != pivot])
+        self._set_arrays(self.z)
+
+    def _set_arrays(self, order):
+        """Positional copies of z and M (object arrays) in the given component order"""
+        self.z_arr = np.empty(len(order), dtype=object)
+        self.M_arr = np.empty(len(order), dtype=object)
+        for i, c in enumerate(order):
+            self.z_arr[i] = self.z[c]
+            self.M_arr[i] = self.M[c]
+
 # ----------------------------------------------------------------------
 # 2) Reactions ---------------------------------------------------------
 class Reaction:
@@ -101,14 +180,50 @@ class MassBalance:
             List of component names
         """
         self.comps = list(components)
+        self._comp_index = {c: i for i, c in enumerate(self.comps)}
         self.streams = {}
         self.reactions = []
         self.splits = []
+        # Unknowns in creation order (dict used as an ordered set)
+        self._unknowns = {}
+        # Equations and solution of the current model; reset whenever it changes
+        self._eqs_cache = None
+        self._sol_cache = None
 
     # ---------- helpers ---------------------------------------------------
     def _get_stream(self, name):  # shortcut to get stream by name
         return self.streams[name]
 
+    def _split_aliases(self):
+        """Map split composition symbols onto the value/symbol they must equal"""
+        aliases = {}
+        for s in self.splits:
+            p = self._get_stream(s.pai)
+            for child in (self._get_stream(s.rec), self._get_stream(s.purge)):
+                for comp in self.comps:
+                    a = aliases.get(child.z[comp], child.z[comp])
+                    b = aliases.get(p.z[comp], p.z[comp])
+                    if a == b:
+                        continue
+                    if isinstance(a, sp.Symbol):
+                        old, new = a, b
+                    elif isinstance(b, sp.Symbol):
+                        old, new = b, a
+                    else:  # two fixed values: left to the equations to reject
+                        continue
+                    aliases = {k: (new if v == old else v) for k, v in aliases.items()}
+                    aliases[old] = new
+        return aliases
+
+    @staticmethod
+    def _stream_unknowns(s):  # symbols a stream contributes to the equations
+        return ([s.F] if isinstance(s.F, sp.Symbol) else []) + \
+            [m for m in s.M.values() if isinstance(m, sp.Symbol)]
+
+    def _invalidate(self):  # model changed: drop cached equations/solution
+        self._eqs_cache = None
+        self._sol_cache = None
+
     # ---------- API for model building ------------------------------------
     def add_stream(self, name, components, direction, flow_rate=None, compositions=None):
         """
@@ -130,7 +245,14 @@ class MassBalance:
             molar fractions when using molar flow units). If None, they will be treated as symbolic.
         """
         s = Stream(name, components, direction, flow_rate, compositions)
+        if list(components) != self.comps:  # keep z_arr/M_arr in model order
+            s._set_arrays(self.comps)
+        if s.name in self.streams:  # replacing a stream: forget its unknowns
+            for sym in self._stream_unknowns(self.streams[s.name]):
+                self._unknowns.pop(sym, None)
         self.streams[s.name] = s
+        self._unknowns.update(dict.fromkeys(self._stream_unknowns(s)))
+        self._invalidate()
 
     def add_reaction(self, stoichiometry, key_component, conversion=None, X=None, conversao=None):
         """
@@ -159,7 +281,10 @@ class MassBalance:
         else:
             raise ValueError("Either 'conversion', 'X', or 'conversao' must be provided")
         
-        self.reactions.append(Reaction(stoichiometry, key_component, actual_conversion))
+        r = Reaction(stoichiometry, key_component, actual_conversion)
+        self.reactions.append(r)
+        self._unknowns[r.eps] = None
+        self._invalidate()
 
     def add_split(self, parent_stream, recycle_stream, purge_stream, fraction=None):
         """
@@ -176,33 +301,52 @@ class MassBalance:
         fraction : float, optional
             Recycle fraction (0-1) - symbolic if None
         """
-        self.splits.append(Split(parent_stream, recycle_stream, purge_stream, fraction))
+        s = Split(parent_stream, recycle_stream, purge_stream, fraction)
+        self.splits.append(s)
+        if isinstance(s.f, sp.Symbol):
+            self._unknowns[s.f] = None
+        self._invalidate()
 
     # ---------- Equations --------------------------------------------------
     def build_equations(self):
         """Build the system of equations for the mass balance model"""
+        if self._eqs_cache is not None:
+            return self._eqs_cache
+
+        # sums are built with a single sp.Add(*terms) so Sympy canonicalizes once
         eqs = []
+        ins = [s for s in self.streams.values() if s.dir == +1]
+        outs = [s for s in self.streams.values() if s.dir == -1]
+        M, aliased = self._split_flows()
 
         # (a) overall balance (inputs = external outputs)
-        IN = sum(s.dir * s.F for s in self.streams.values() if s.dir == +1)
-        OUT = sum(-s.dir * s.F for s in self.streams.values() if s.dir == -1)
+        IN = sp.Add(*[s.F for s in ins])
+        OUT = sp.Add(*[s.F for s in outs])
         eqs.append(sp.Eq(IN, OUT))
 
+        # component inflows, shared by the balances (b) and the extents (d)
+        inlet = [sp.Add(*[M[s.name][i] for s in ins]) for i in range(len(self.comps))]
+
+        # generation terms, only for the reactions a component takes part in
+        gen_map = {comp: [(r.nu[comp], r.eps) for r in self.reactions if comp in r.nu]
+                   for comp in self.comps}
+
         # (b) component balances
-        for comp in self.comps:
-            acc_in = sum(s.dir * s.F * s.z[comp] for s in self.streams.values() if s.dir == +1)
-            acc_out = sum(-s.dir * s.F * s.z[comp] for s in self.streams.values() if s.dir == -1)
-            gen = sum(r.nu.get(comp, 0) * r.eps for r in self.reactions)
+        for i, comp in enumerate(self.comps):
+            acc_in = inlet[i]
+            acc_out = sp.Add(*[M[s.name][i] for s in outs])
+            gen = sp.Add(*[nu * eps for nu, eps in gen_map[comp]])
             eqs.append(sp.Eq(acc_in + gen, acc_out))
 
-        # (c) composition normalization for each stream
+        # (c) composition normalization; streams with unknown fractions
+        # satisfy it by construction of their pivot component flow
         for s in self.streams.values():
-            eqs.append(sp.Eq(sum(s.z.values()), 1))
+            if not any(isinstance(z, sp.Symbol) for z in s.z_arr):
+                eqs.append(sp.Eq(sp.Add(*s.z_arr), 1))
 
         # (d) conversions → extents
         for r in self.reactions:
-            m_in_key = sum(s.dir * s.F * s.z[r.key] for s in self.streams.values()
-                          if s.dir == +1)  # mass of key reactant entering
+            m_in_key = inlet[self._comp_index[r.key]]  # mass of key reactant entering
             eqs.append(sp.Eq(r.eps, r.X * m_in_key))
 
         # (e) splits (recycle)
@@ -211,22 +355,236 @@ class MassBalance:
             # flow rates
             eqs += [sp.Eq(r.F, s.f * p.F),
                     sp.Eq(g.F, (1 - s.f) * p.F)]
-            # compositions are equal
-            for comp in self.comps:
-                eqs += [sp.Eq(r.z[comp], p.z[comp]),
-                        sp.Eq(g.z[comp], p.z[comp])]
+            # compositions are equal, i.e. component flows split like F;
+            # outlets aliased in _split_flows need no equations here
+            for child, frac in ((r, s.f), (g, 1 - s.f)):
+                if child.name not in aliased:
+                    eqs += [sp.Eq(child.M_arr[i], frac * M[p.name][i])
+                            for i in range(len(self.comps))]
+
+        # component flows of aliased outlets are no longer unknowns
+        dropped = {m for name in aliased for m in self.streams[name].M.values()
+                   if isinstance(m, sp.Symbol)}
+        self._eqs_unknowns = [u for u in self._unknowns if u not in dropped]
 
+        self._eqs_cache = eqs
         return eqs
 
+    def _split_flows(self):
+        """
+        Component flows per stream, with split outlets of unknown composition
+        written directly as fraction × parent flows (no equations needed).
+
+        Returns (dict stream name -> component-flow array, set of aliased names)
+        """
+        M = {name: s.M_arr for name, s in self.streams.items()}
+        parent = {}
+        for s in self.splits:
+            parent[s.rec] = (s.pai, s.f)
+            parent[s.purge] = (s.pai, 1 - s.f)
+
+        aliased = set()
+
+        def resolve(name):  # parents first, for chained splits
+            if name in aliased or name not in parent:
+                return M[name]
+            s = self.streams[name]
+            if not all(isinstance(z, sp.Symbol) for z in s.z_arr):
+                return M[name]
+            pai, frac = parent[name]
+            M[name] = np.array([frac * m for m in resolve(pai)], dtype=object)
+            aliased.add(name)
+            return M[name]
+
+        for name in parent:
+            resolve(name)
+        return M, aliased
+
     # ---------- solution ---------------------------------------------------
+    def _active_equations(self):
+        """Equations left to solve (fixed-value checks that hold are dropped)"""
+        eqs = []
+        for e in self.build_equations():
+            if e is sp.false:
+                raise ValueError("System is underdetermined or has no solution.")
+            if e is not sp.true:
+                eqs.append(e)
+        return eqs
+
+    def _signature(self):
+        """Hashable description of the model (everything the solution depends on)"""
+        def value(v):
+            return None if isinstance(v, sp.Symbol) else float(v)
+        return (
+            tuple(self.comps),
+            tuple((s.name, s.dir, value(s.F), tuple((c, value(z)) for c, z in s.z.items()))
+                  for s in self.streams.values()),
+            tuple((tuple(sorted(r.nu.items())), r.key, r.X) for r in self.reactions),
+            tuple((s.pai, s.rec, s.purge, value(s.f)) for s in self.splits),
+        )
+
+    def _model_symbols(self):  # per-instance symbols (numbered by class counters)
+        return [r.eps for r in self.reactions] + [s.f for s in self.splits]
+
+    def _shared_solution(self):
+        """Solution of an identical model solved earlier in this process, if any"""
+        key = self._signature()
+        with _SOLUTION_CACHE_LOCK:
+            entry = _SOLUTION_CACHE.get(key)
+            if entry is None:
+                return None
+            _SOLUTION_CACHE.move_to_end(key)
+        sol, symbols = entry
+        sol = dict(sol)
+        for old, new in zip(symbols, self._model_symbols()):
+            if old in sol:
+                sol[new] = sol.pop(old)
+        self._sol_cache = sol
+        return sol
+
     def solve(self):
-        """Solve the mass balance equations"""
-        eqs = self.build_equations()
-        symbols = set().union(*(e.free_symbols for e in eqs))
-        sol = sp.solve(eqs, list(symbols), dict=True)
-        if not sol:
-            raise ValueError("System is underdetermined or has no solution.")
-        return sol[0]
+        """Solve the mass balance equations (cached until the model changes)"""
+        if self._sol_cache is not None:
+            return self._sol_cache
+        shared = self._shared_solution()
+        if shared is not None:
+            return shared
+
+        eqs = self._active_equations()
+        symbols = self._eqs_unknowns
+        sol = self._solve_linear(eqs, symbols)
+        if sol is None:
+            try:  # singular or underdetermined linear system
+                sols = [dict(zip(symbols, x)) for x in sp.linsolve(eqs, symbols)]
+            except NonlinearError:  # symbolic split fraction
+                sols = sp.solve(eqs, symbols, dict=True)
+            if not sols:
+                raise ValueError("System is underdetermined or has no solution.")
+            sol = sols[0]
+        return self._complete_solution(sol)
+
+    def solve_numeric(self):
+        """
+        Solve the mass balance as a sparse numeric system.
+
+        Applies when every split fraction is given, so that all equations are
+        linear with numeric coefficients; otherwise (or if the system is
+        singular) falls back to solve(). Cached like solve().
+        """
+        if self._sol_cache is not None:
+            return self._sol_cache
+        shared = self._shared_solution()
+        if shared is not None:
+            return shared
+        if any(isinstance(s.f, sp.Symbol) for s in self.splits):
+            return self.solve()
+
+        eqs = self._active_equations()
+        symbols = self._eqs_unknowns
+        if len(eqs) < len(symbols):
+            return self.solve()
+        col = {u: j for j, u in enumerate(symbols)}
+        rows, cols, data = [], [], []
+        b = np.zeros(len(eqs))
+        for i, e in enumerate(eqs):
+            for term, coeff in (e.lhs - e.rhs).as_coefficients_dict().items():
+                if term is sp.S.One:
+                    b[i] -= float(coeff)
+                elif term in col:
+                    rows.append(i)
+                    cols.append(col[term])
+                    data.append(float(coeff))
+                else:  # not linear in the unknowns
+                    return self.solve()
+        A = csr_matrix((data, (rows, cols)), shape=(len(eqs), len(symbols)))
+
+        x = self._solve_independent(A, b, _sparse_lu_solve)
+        if x is None:
+            return self.solve()
+        return self._complete_solution(dict(zip(symbols, _exact_values(x))))
+
+    def _complete_solution(self, sol):
+        """Add the compositions to a solution of the unknowns and cache it"""
+        aliases = self._split_aliases()
+        # recover the unknown compositions as z = M/F
+        for st in self.streams.values():
+            F = sol.get(st.F, st.F)
+            for comp, z in st.z.items():
+                if not isinstance(z, sp.Symbol) or z in aliases:
+                    continue
+                if F.is_zero:  # Float(0.0) != 0 in SymPy, so test is_zero
+                    raise ValueError(f"Zero flow rate calculated for stream '{st.name}', so its composition is undefined.")
+                M = st.M[comp]
+                sol[z] = (sol[M] if M in sol else M.xreplace(sol)) / F
+        # split outlets share the parent's composition, even at zero flow
+        for alias, target in aliases.items():
+            sol[alias] = sol.get(target, target)
+        self._sol_cache = sol
+        with _SOLUTION_CACHE_LOCK:
+            _SOLUTION_CACHE[self._signature()] = (dict(sol), self._model_symbols())
+            if len(_SOLUTION_CACHE) > _SOLUTION_CACHE_SIZE:
+                _SOLUTION_CACHE.popitem(last=False)
+        return sol
+
+    @staticmethod
+    def _solve_independent(A, b, solver):
+        """
+        Solve A x = b, with A (m, n) and m >= n. A square A goes straight to
+        solver. With m > n, balances repeat what the split equations already
+        fix, so one independent row per unknown is kept, picked by pivoted QR
+        of A^T; the dropped ones must still hold.
+        Returns None when A is singular or the system is inconsistent.
+        """
+        m, n = A.shape
+        if n == 0:
+            return np.zeros(0)
+        if m > n:
+            dense = A.toarray() if hasattr(A, 'toarray') else A
+            _, R, rows = qr(dense.T, mode='economic', pivoting=True)
+            if abs(R[n - 1, n - 1]) <= 1e-10 * abs(R[0, 0]):
+                return None  # rank deficient: underdetermined
+            keep = np.sort(rows[:n])
+            A_sq, b_sq = A[keep], b[keep]
+        else:
+            A_sq, b_sq = A, b
+        try:
+            x = solver(A_sq, b_sq)
+        except (RuntimeError, np.linalg.LinAlgError):  # exactly singular
+            return None
+        if not np.isfinite(x).all() or \
+                not np.allclose(A @ x, b, rtol=1e-9, atol=1e-9 * max(1.0, np.abs(b).max(initial=0))):
+            return None
+        return x
+
+    @staticmethod
+    def _solve_linear(eqs, symbols):
+        """
+        Solve a linear system: symbolic LU when square, an independent square
+        block when it carries redundant equations. None when it does not apply.
+        """
+        if len(eqs) < len(symbols):
+            return None
+        try:
+            A, b = sp.linear_eq_to_matrix(eqs, symbols)
+        except NonlinearError:
+            return None
+
+        if A.shape[0] == A.shape[1]:
+            try:
+                x = A.LUsolve(b, iszerofunc=lambda v: v.is_zero is True)
+            except ValueError:
+                return None
+            return dict(zip(symbols, x))
+
+        try:
+            An = np.array(A.tolist(), dtype=float)
+            bn = np.array(b.tolist(), dtype=float).ravel()
+        except TypeError:  # symbolic coefficients
+            return None
+        x = MassBalance._solve_independent(An, bn, np.linalg.solve)
+        if x is None:
+            return None
+        return dict(zip(symbols, _exact_values(x)))
 
     def get_results(self, solution=None):
         """
@@ -235,7 +593,7 @@ class MassBalance:
         Parameters:
         -----------
         solution : dict, optional
-            Solution dictionary from solve() (if None, solve() is called)
+            Solution dictionary from solve() (if None, solve_numeric() is called)
             
         Returns:
         --------
@@ -244,20 +602,24 @@ class MassBalance:
             and compositions (mass or molar fractions depending on flow rate units)
         """
         if solution is None:
-            solution = self.solve()
+            solution = self.solve_numeric()
             
+        # gather [F, z...] per stream and convert to floats in one pass
+        values = []
+        for stream in self.streams.values():
+            values.append(solution.get(stream.F, stream.F))
+            values.extend(solution.get(z, z) for z in stream.z.values())
+        values = np.array(values, dtype=float).tolist()
+
         results = {}
+        i = 0
         for stream_name, stream in self.streams.items():
-            stream_results = {
-                'flow_rate': float(solution.get(stream.F, stream.F)),
-                'compositions': {}
+            results[stream_name] = {
+                'flow_rate': values[i],
+                'compositions': dict(zip(stream.z, values[i + 1:i + 1 + len(stream.z)]))
             }
-            
-            for comp, z in stream.z.items():
-                stream_results['compositions'][comp] = float(solution.get(z, z))
-                
-            results[stream_name] = stream_results
-            
+            i += 1 + len(stream.z)
+
         return results 
         
     def validate_results(self, results=None):
@@ -279,27 +641,27 @@ class MassBalance:
         """
         if results is None:
             results = self.get_results()
-            
-        # Check for negative flow rates
-        for stream_name, stream_data in results.items():
-            if stream_data["flow_rate"] < 0:
-                return False, f"Negative flow rate detected for stream '{stream_name}': {stream_data['flow_rate']}"
-        
-        # Check for negative component fractions and sum close to 1
-        for stream_name, stream_data in results.items():
-            compositions = stream_data["compositions"]
-            
-            # Check for negative component fractions
-            for component, fraction in compositions.items():
-                if fraction < 0:
-                    return False, f"Negative composition detected for component '{component}' in stream '{stream_name}': {fraction}"
-            
-            # Check if component fractions sum close to 1
-            sum_fractions = sum(compositions.values())
-            if not (0.99 <= sum_fractions <= 1.01):
-                return False, f"Component fractions in stream '{stream_name}' do not sum to approximately 1: {sum_fractions}"
-        
-        return True, ""
+        if not results:
+            return True, ""
+
+        names = list(results)
+        flows = np.array([results[n]["flow_rate"] for n in names], dtype=float)
+        fractions = np.array([list(results[n]["compositions"].values()) for n in names],
+                             dtype=float).reshape(len(names), -1)
+
+        kind, i, j = _first_violation(flows, fractions)
+        if kind == 0:
+            return True, ""
+
+        stream_name = names[i]
+        stream_data = results[stream_name]
+        if kind == 1:
+            return False, f"Negative flow rate detected for stream '{stream_name}': {stream_data['flow_rate']}"
+        if kind == 2:
+            component, fraction = list(stream_data["compositions"].items())[j]
+            return False, f"Negative composition detected for component '{component}' in stream '{stream_name}': {fraction}"
+        sum_fractions = sum(stream_data["compositions"].values())
+        return False, f"Component fractions in stream '{stream_name}' do not sum to approximately 1: {sum_fractions}"
         
     @staticmethod
     def validate_stream_compositions(stream):
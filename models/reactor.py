@@ -1,17 +1,187 @@
-from scipy.optimize import root_scalar
+from scipy.optimize import brentq
 
+from collections import namedtuple
+from functools import lru_cache, reduce
+from operator import mul
 from typing import Dict
 
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 
 import numpy as np
 
 from scipy.integrate import quad
 
+import pint
 from pint import UnitRegistry
 
 from base_validator import BaseValidator
 
+# One registry per process, shared as pint's application registry; the parsed
+# unit definitions are cached on disk so later processes skip the parsing
+_UREG = UnitRegistry(cache_folder=":auto:")
+pint.set_application_registry(_UREG)
+
+# Gauss–Legendre rules on [-1, 1] for the PFR design integral (the 8-point rule checks the 16-point one)
+_GL16 = np.polynomial.legendre.leggauss(16)
+_GL8 = np.polynomial.legendre.leggauss(8)
+
+# Units used on every call
+_U_M3 = _UREG.m**3
+_U_M3_PER_S = _UREG.m**3 / _UREG.s
+_U_MOL_PER_S = _UREG.mol / _UREG.s
+_U_MOL_PER_L = _UREG.mol / _UREG.L
+_U_MOL_PER_M3 = _UREG.mol / _UREG.m**3
+_U_RATE = _UREG.Unit("mol/m**3/s")
+_MOL_PER_L_TO_MOL_PER_M3 = (1 * _U_MOL_PER_L).to(_U_MOL_PER_M3).magnitude
+
+# Mixed inlet of a reactor call, in SI magnitudes
+_InletState = namedtuple("_InletState", ["F0", "Q_tot", "C0", "limiting"])
+
+
+@lru_cache(maxsize=32)
+def _k_unit_for(orders):
+    """Unit of k that makes k·∏C_i^{n_i} a rate in mol/m³/s, for C_i in mol/m³."""
+    return _U_RATE / reduce(mul, (_U_MOL_PER_M3**n for n in orders if n != 0), _UREG.dimensionless)
+
+
+@lru_cache(maxsize=32)
+def _conversion_factor(units, target):
+    """Multiplier taking a magnitude in `units` to `target` (both pint Units); built once per pair."""
+    return _UREG.Quantity(1.0, units).to(target).magnitude
+
+
+@_UREG.wraps(None, ("K", "K", "Pa", "Pa"), strict=False)
+def _pressure_temperature_factor(T0, T, P0, P):
+    """
+    P0·T/(P·T0) on plain magnitudes. pint only acts at the boundary: quantities are
+    converted to K and Pa on entry, plain floats are taken as already in those units.
+    """
+    return P0 * T / (P * T0)
+
+
+@lru_cache(maxsize=32)
+def _epsilon_slope(states, nu, limiting):
+    """(Σν_prod − Σ|ν_reag|)/|ν_lim| when any component is gaseous, 0.0 otherwise."""
+    if "gaseous" not in states:
+        return 0.0
+    mols_prod = sum(coef for coef in nu if coef > 0)
+    mols_reag = sum(abs(coef) for coef in nu if coef < 0)
+    return (mols_prod - mols_reag) / abs(nu[limiting])
+
+
+def _linear_concentrations(C0, nu, limiting):
+    """
+    Splits the outlet concentrations into C_i·dilution = C_in + slope·X, for X below
+    the conversion at which component i runs out (inf for products and the limiting reagent).
+    """
+    nu_lim = abs(nu[limiting])
+    C_lim0 = C0[limiting]
+    slopes, used_up = [], []
+    for i, nu_i in enumerate(nu):
+        if nu_i < 0 and i != limiting:  # other reactants: X_i = X / ratio, capped at 100%
+            ratio = abs(nu_i) / nu_lim
+            slopes.append(-C0[i] / ratio)
+            used_up.append(ratio)
+        else:
+            slopes.append(-C0[i] if i == limiting else nu_i / nu_lim * C_lim0)
+            used_up.append(float("inf"))
+    return tuple(C0), tuple(slopes), tuple(used_up)
+
+
+def _require_positive_dilution(dilution):
+    """
+    Raises unless the dilution factor (1+ε·X)·P0T/(PT0) is positive. It is linear in X,
+    so for a conversion range its values at both ends are enough.
+    """
+    if not np.all(np.asarray(dilution) > 0):
+        raise ValueError("Too high conversion — non-positive dilution factor calculated.")
+
+
+def _outlet_concentrations(X, C0, nu, limiting, dilution):
+    """
+    Outlet concentrations (mol/m³) at conversion X, components on the last axis.
+    X and dilution may be arrays of conversions; the model is the one of _conversion_residual.
+    """
+    nu = np.asarray(nu, dtype=float)
+    ratio = np.abs(nu) / abs(nu[limiting])
+    # reactants other than the limiting one cannot go past 100% conversion
+    cap = np.where((nu < 0) & (np.arange(nu.size) != limiting), 1.0, np.inf)
+    X = np.asarray(X, dtype=float)[..., None]
+    dilution = np.asarray(dilution, dtype=float)[..., None]
+    reactant = C0 * (1 - np.minimum(X / ratio, cap))
+    product = C0 + ratio * C0[limiting] * X
+    return np.where(nu < 0, reactant, product) / dilution
+
+
+def _reaction_rate(concentrations, orders, k):
+    """r = k ∏ C_i^{n_i} (mol/m³/s) over the last axis; components past the given orders count as n = 0."""
+    n = np.zeros(concentrations.shape[-1])
+    n[:len(orders)] = orders
+    return k * np.prod(concentrations ** n, axis=-1, where=n != 0)
+
+
+def _gauss_legendre(f, a, b, rule):
+    """∫_a^b f(x) dx with a fixed Gauss–Legendre rule; f is evaluated once on all nodes."""
+    nodes, weights = rule
+    half = 0.5 * (b - a)
+    return half * np.dot(weights, f(half * nodes + 0.5 * (a + b)))
+
+
+def _cumulative_integral(f, points, rule=_GL16):
+    """∫ f from points[0] to each of the (sorted) points, with one Gauss–Legendre rule per interval."""
+    nodes, weights = rule
+    a, b = points[:-1, None], points[1:, None]
+    half = 0.5 * (b - a)
+    segments = half[:, 0] * (f(half * nodes + 0.5 * (a + b)) @ weights)
+    return np.concatenate(([0.0], np.cumsum(segments)))
+
+
+def _conversion_residual(X, C_in, slopes, used_up, orders, eps, var_op, scale):
+    """
+    X_calc - X for the design equation X = |ν_lim|·r·V/F_A0 (scale = |ν_lim|·k·V/F_A0), on plain floats.
+    Kept to the nopython subset (tuples of floats, no dicts or quantities); the tuples
+    only hold the components that enter the rate law (see _reacting_terms).
+    """
+    dilution = (1 + eps * X) * var_op
+    rate_expression = 1.0
+    for i in range(len(C_in)):
+        Ci = 0.0 if X >= used_up[i] else (C_in[i] + slopes[i] * X) / dilution
+        rate_expression *= Ci ** orders[i]
+    return scale * rate_expression - X
+
+
+def _reacting_terms(C_in, slopes, used_up, orders):
+    """Keeps only the components with a nonzero reaction order, whose Ci**n is not just 1."""
+    terms = [i for i in range(min(len(C_in), len(orders))) if orders[i] != 0]
+    return (tuple(C_in[i] for i in terms), tuple(slopes[i] for i in terms),
+            tuple(used_up[i] for i in terms), tuple(orders[i] for i in terms))
+
+
+def _negative_concentration(X, C_in, slopes, used_up, eps, var_op):
+    """True if any outlet concentration of _conversion_residual is negative at X."""
+    dilution = (1 + eps * X) * var_op
+    for i in range(len(C_in)):
+        if X < used_up[i] and (C_in[i] + slopes[i] * X) / dilution < 0:
+            return True
+    return False
+
+
+def _solve_conversion(lower, upper, args, check_negative=False):
+    """
+    Root of _conversion_residual in [lower, upper]. brentq only evaluates inside the
+    bracket, keeps the usual sign-change error and raises if it does not converge.
+    With check_negative, the concentrations are checked once at both ends of the bracket
+    instead of on every iteration: C_i·dilution and the dilution are both linear in X,
+    so a sign change inside the bracket already shows at one of its ends.
+    """
+    C_in, slopes, used_up, orders, eps, var_op, scale = args
+    if check_negative and (_negative_concentration(lower, C_in, slopes, used_up, eps, var_op)
+                           or _negative_concentration(upper, C_in, slopes, used_up, eps, var_op)):
+        raise ValueError("Ci is negative")
+    return brentq(_conversion_residual, lower, upper,
+                  args=(*_reacting_terms(C_in, slopes, used_up, orders), eps, var_op, scale))
+
+
 class ReactorIsothermalHeterogeneous(BaseValidator):
     """Reactor utility class"""
 
@@ -19,66 +189,51 @@ class ReactorIsothermalHeterogeneous(BaseValidator):
     #                               INIT                                 #
     # ------------------------------------------------------------------ #
     def __init__(self) -> None:
-        self.ureg = UnitRegistry()
+        self.ureg = _UREG
 
     # ------------------------------------------------------------------ #
     #                         PRIVATE HELPERS                            #
     # ------------------------------------------------------------------ #
-    def _calculate_dilution_factor(self, components, stoichiometric_coefficients, limiting, X):
-        """Calculate the dilution factor based on the stoichiometric coefficients and conversion."""
-        has_gas_phase = any(c["state"] == "gaseous" for c in components)
-        
-        if has_gas_phase:
-            mols_prod = sum(coef for coef in stoichiometric_coefficients if coef > 0)
-            mols_reag = sum(abs(coef) for coef in stoichiometric_coefficients if coef < 0)
-            ε = (mols_prod - mols_reag) / abs(stoichiometric_coefficients[limiting]) * X
-        else:
-            ε = 0.0
-        
-        return ε
+    def _require_single_phase(self, components):
+        """Raises unless every component is in the same state (all liquid or all gaseous)."""
+        if len({c["state"] for c in components}) > 1:
+            raise ValueError("Use only liquid or only gaseous components")
+
+    def _operating_factor(self, operation_conditions):
+        """Correction factor P0·T/(P·T0) for the operating conditions (temperatures in K, pressures in Pa)."""
+        return _pressure_temperature_factor(operation_conditions["initial_temperature"], operation_conditions["final_temperature"],
+                                            operation_conditions["initial_pressure"], operation_conditions["final_pressure"])
+
+    def _dilution_slope(self, components, stoichiometric_coefficients, limiting):
+        """Slope of the dilution factor in the conversion: ε = slope·X."""
+        return _epsilon_slope(tuple(c["state"] for c in components), tuple(stoichiometric_coefficients), limiting)
     
+    def _inlet_state(self, parameters):
+        """Limiting reagent and mixed inlet: F0_i (mol/s), Q_tot (m³/s) and C0_i (mol/m³) as plain floats."""
+        limiting = self.determine_limiting_reagent(parameters)
+        F0, Q_tot = [], 0.0
+        for c in parameters["components"]:
+            F0.append(c["flow_rate_inlet"] * (c["molar_concentration_inlet"] * _MOL_PER_L_TO_MOL_PER_M3))
+            Q_tot += c["flow_rate_inlet"]
+        return _InletState(tuple(F0), Q_tot, tuple(F / Q_tot for F in F0), limiting)
+
     def _calculate_concentration_and_rate(self, components, stoichiometric_coefficients, reaction_rate_params, 
-                                        limiting, C0_i, C_lim0, X, dilution_factor):
+                                        limiting, C0, X, dilution_factor):
         """Calculate the reactor concentrations and reaction rate for a given conversion."""
-        outlet_concentrations = {}
-        concentration_values = []
-        for i in range(len(components)):
-            if stoichiometric_coefficients[i] < 0:  # reactant
-                if i == limiting:
-                    # For the limiting reactant
-                    Ci = C0_i[i] * (1 - X) / dilution_factor
-                else:
-                    # For other reactants
-                    theta_i = C0_i[i]/C_lim0
-                    stoichiometric_ratio = abs(stoichiometric_coefficients[i]) / abs(stoichiometric_coefficients[limiting])
-                    X_i = X / stoichiometric_ratio
-                    if X_i > 1:  # Cannot have more than 100% conversion
-                        X_i = 1
-                    Ci = C0_i[i] * (1 - X_i) / dilution_factor
-            else: 
-                if stoichiometric_coefficients[i] > 0:  # product
-                    # For products
-                    stoichiometric_ratio = stoichiometric_coefficients[i] / abs(stoichiometric_coefficients[limiting])
-                    # Ensure C_lim0 is a single value, not a sequence
-                    lim_conc = C_lim0 if isinstance(C_lim0, (int, float)) or hasattr(C_lim0, 'magnitude') else C_lim0[0]
-                    Ci = (C0_i[i] + stoichiometric_ratio * lim_conc * X) / dilution_factor
-                else:  # Inert (stoichiometric_coefficients[i] = 0)
-                    # For inerts, just dilution
-                    Ci = C0_i[i] / dilution_factor
-            
-            component_name = components[i]["component_name"]
-            outlet_concentrations[component_name] = Ci
-            concentration_values.append(Ci)
-                
+        dilution_factor = getattr(dilution_factor, "magnitude", dilution_factor)
+        _require_positive_dilution(dilution_factor)
+        concentrations = _outlet_concentrations(getattr(X, "magnitude", X), C0, stoichiometric_coefficients,
+                                                limiting, dilution_factor)
+        # One array-backed Quantity for every outlet concentration, split per component at the end
+        outlet_concentrations = dict(zip((c["component_name"] for c in components),
+                                         _UREG.Quantity(concentrations, _U_MOL_PER_M3)))
+
         # Calculate the reaction rate r = k ∏ C_i^{n_i}
-        rate_expression = 1.0  # Initialize variable
-        for i, n_i in enumerate(reaction_rate_params["reaction_orders"]):
-            if n_i != 0:  # Only consider terms with non-zero order
-                rate_expression *= concentration_values[i] ** n_i
-        
-        k_unit = self.ureg.Unit('mol/m³/s') / rate_expression.units
-        k = reaction_rate_params["k"] * k_unit
-        r = k * rate_expression
+        k = reaction_rate_params["k"] * _k_unit_for(tuple(reaction_rate_params["reaction_orders"]))
+        r = float(_reaction_rate(concentrations, reaction_rate_params["reaction_orders"], k.magnitude))
+        if not (np.isfinite(concentrations).all() and np.isfinite(r)):
+            raise ValueError("Non-finite concentration or reaction rate calculated.")
+        r = r * _U_RATE
         
         return outlet_concentrations, k, r
 
@@ -96,55 +251,29 @@ class ReactorIsothermalHeterogeneous(BaseValidator):
         operation_conditions = parameters["operation_conditions"]
         X = parameters["conversion"] * self.ureg.dimensionless  # dimensionless
     
-        last_component_state = components[0]["state"]
-        for component in components:
-            if last_component_state != component["state"]:
-                last_component_state = component["state"]
-                raise ValueError("Use only liquid or only gaseous components")
-    
-        limiting = self.determine_limiting_reagent(parameters)
+        self._require_single_phase(components)
     
-        # Initialize variables
-        F0_i = []
-        Q_tot = 0 * self.ureg.m**3 / self.ureg.s  # initialize with zero, with unit
-        
-        # Calculate inlet molar flow rates and total volumetric flow rate
-        for c in components:
-            flow_rate = c["flow_rate_inlet"] * self.ureg.m**3 / self.ureg.s
-            conc = (c["molar_concentration_inlet"] * self.ureg.mol / self.ureg.L).to(self.ureg.mol / self.ureg.m**3)
-            F0_i.append(flow_rate * conc)  # mol/s for each component
-            Q_tot += flow_rate
-                
-        F_A0 = F0_i[limiting]  # mol/s for the limiting reagent
-        C0_i = [F0 / Q_tot for F0 in F0_i]  # concentrations after mixing (mol/m³)
-        C_lim0 = C0_i[limiting]
+        inlet = self._inlet_state(parameters)
+        limiting = inlet.limiting
+        F_A0 = inlet.F0[limiting] * _U_MOL_PER_S  # mol/s for the limiting reagent
+        Q_tot = inlet.Q_tot * _U_M3_PER_S
         
-        ε = self._calculate_dilution_factor(components, stoichiometric_coefficients, limiting, X) * F_A0 / sum(F0_i)
-        
-        # Operating conditions: temperature and pressure
-        T0 = operation_conditions["initial_temperature"] * self.ureg.K
-        P0 = operation_conditions["initial_pressure"] * self.ureg.Pa
-        T = operation_conditions["final_temperature"] * self.ureg.K
-        P = operation_conditions["final_pressure"] * self.ureg.Pa
+        ε = self._dilution_slope(components, stoichiometric_coefficients, limiting) * X * inlet.F0[limiting] / sum(inlet.F0)
         
         # Correction factor for operating conditions (pressure and temperature)
-        var_operation_conditions = (P0*T/(P*T0)).magnitude  # Dimensionless
+        var_operation_conditions = self._operating_factor(operation_conditions)  # Dimensionless
         
         # Combined factor: effect of volumetric variation and operating conditions
         dilution_factor = (1 + (ε * X)) * var_operation_conditions
         
         outlet_concentrations, k, r = self._calculate_concentration_and_rate(
             components, stoichiometric_coefficients, reaction_rate_params, 
-            limiting, C0_i, C_lim0, X, dilution_factor
+            limiting, inlet.C0, X, dilution_factor
         )
         
         if any(C.magnitude < 0 for C in outlet_concentrations.values()):
             raise ValueError("Too high conversion — negative concentration calculated.")
         
-        # Check if r has the correct units (mol/m³/s)
-        if r.units != self.ureg.Unit('mol/m³/s'):
-            raise ValueError(f"Incorrect unit for reaction rate: {r.units}. Expected: mol/m³/s")
-        
         if r.magnitude == 0:
             raise ValueError("The reaction rate cannot be zero.")
     
@@ -177,65 +306,35 @@ class ReactorIsothermalHeterogeneous(BaseValidator):
         stoichiometric_coefficients = parameters["stoichiometric_coefficients"]
         reaction_rate_params = parameters["reaction_rate_params"]
         operation_conditions = parameters["operation_conditions"]
-        V = parameters["volume"] * self.ureg.m**3  # volume in cubic meters
+        V = parameters["volume"] * _U_M3  # volume in cubic meters
 
-        last_component_state = components[0]["state"]
-        for component in components:
-            if last_component_state != component["state"]:
-                last_component_state = component["state"]
-                raise ValueError("Use only liquid or only gaseous components")
-    
-        limiting = self.determine_limiting_reagent(parameters)
-    
-        F0_i = []
-        Q_tot = 0 * self.ureg.m**3 / self.ureg.s  # initialize with zero, with unit
-        for c in components:
-            flow_rate = c["flow_rate_inlet"] * self.ureg.m**3 / self.ureg.s
-            conc = (c["molar_concentration_inlet"] * self.ureg.mol / self.ureg.L).to(self.ureg.mol / self.ureg.m**3)
-            F0_i.append(flow_rate * conc)  # mol/s for each component
-            Q_tot += flow_rate
+        self._require_single_phase(components)
     
-        F_A0 = F0_i[limiting]  # mol/s for the limiting reagent
-        C0_i = [F0 / Q_tot for F0 in F0_i]  # concentrations after mixing (mol/m³)
-        C_lim0 = C0_i[limiting]
+        inlet = self._inlet_state(parameters)
+        limiting = inlet.limiting
+        F_A0 = inlet.F0[limiting] * _U_MOL_PER_S  # mol/s for the limiting reagent
+        Q_tot = inlet.Q_tot * _U_M3_PER_S
     
-        ε_base = self._calculate_dilution_factor(components, stoichiometric_coefficients, limiting, F_A0 / sum(F0_i))
-    
-        T0 = operation_conditions["initial_temperature"] * self.ureg.K
-        P0 = operation_conditions["initial_pressure"] * self.ureg.Pa
-        T = operation_conditions["final_temperature"] * self.ureg.K
-        P = operation_conditions["final_pressure"] * self.ureg.Pa
-    
-        var_operation_conditions = (P0 * T / (P * T0)).magnitude
-    
-        def objective(X_val):
-            if not (0 < X_val < 1):
-                raise ValueError("Conversion out of bounds")
-            
-            dilution_factor = (1 + (ε_base * X_val)) * var_operation_conditions
-            
-            outlet_concentrations, k, r = self._calculate_concentration_and_rate(
-                components, stoichiometric_coefficients, reaction_rate_params, 
-                limiting, C0_i, C_lim0, X_val, dilution_factor
-            )
-            
-            if any(Ci.magnitude < 0 for Ci in outlet_concentrations.values()):
-                raise ValueError("Ci is negative")
-                
-            rate_lim = abs(stoichiometric_coefficients[limiting]) * r
-            X_calc = (rate_lim * V / F_A0).to_base_units().magnitude
-            return X_calc - X_val
+        ε_base = self._dilution_slope(components, stoichiometric_coefficients, limiting) * (inlet.F0[limiting] / sum(inlet.F0))
     
-        result = root_scalar(objective, bracket=[1e-6, 0.999], method='brentq')
-        if not result.converged:
-            raise ValueError("Failed to converge to a valid conversion value.")
+        var_operation_conditions = self._operating_factor(operation_conditions)
     
-        X = result.root * self.ureg.dimensionless
+        # The root finder works on plain SI magnitudes; quantities are only rebuilt for the result
+        C_in, slopes, used_up = _linear_concentrations(
+            inlet.C0, stoichiometric_coefficients, limiting)
+        orders = tuple(reaction_rate_params["reaction_orders"])
+        scale = (abs(stoichiometric_coefficients[limiting]) * float(reaction_rate_params["k"])
+                 * V.magnitude * _conversion_factor(V.units, _U_M3) / inlet.F0[limiting])
+        eps = float(ε_base)
+
+        X_root = _solve_conversion(1e-6, 0.999,
+                                   (C_in, slopes, used_up, orders, eps, var_operation_conditions, scale), check_negative=True)
+        X = X_root * self.ureg.dimensionless
 
         dilution_factor = (1 + (ε_base * X)) * var_operation_conditions
         outlet_concentrations, k, r = self._calculate_concentration_and_rate(
             components, stoichiometric_coefficients, reaction_rate_params, 
-            limiting, C0_i, C_lim0, X, dilution_factor
+            limiting, inlet.C0, X, dilution_factor
         )
     
         return {
@@ -260,60 +359,34 @@ class ReactorIsothermalHeterogeneous(BaseValidator):
         operation_conditions = parameters["operation_conditions"]
         residence_time = parameters["residence_time"] * self.ureg.s  # residence time in seconds
 
-        limiting = self.determine_limiting_reagent(parameters)
-
-        F0_i = []
-        Q_tot = 0 * self.ureg.m**3 / self.ureg.s  # initialize with zero, with unit
-        for c in components:
-            flow_rate = c["flow_rate_inlet"] * self.ureg.m**3 / self.ureg.s
-            conc = (c["molar_concentration_inlet"] * self.ureg.mol / self.ureg.L).to(self.ureg.mol / self.ureg.m**3)
-            F0_i.append(flow_rate * conc)  # mol/s for each component
-            Q_tot += flow_rate
-
-        F_A0 = F0_i[limiting]  # mol/s for the limiting reagent
-        C0_i = [F0 / Q_tot for F0 in F0_i]  # concentrations after mixing (mol/m³)
-        C_lim0 = C0_i[limiting]
+        inlet = self._inlet_state(parameters)
+        limiting = inlet.limiting
+        F_A0 = inlet.F0[limiting] * _U_MOL_PER_S  # mol/s for the limiting reagent
+        Q_tot = inlet.Q_tot * _U_M3_PER_S
         
         # Reactor volume based on residence time
         V = Q_tot * residence_time  # m³
         
-        ε_base = self._calculate_dilution_factor(components, stoichiometric_coefficients, limiting, F_A0 / sum(F0_i))
-        
-        T0 = operation_conditions["initial_temperature"] * self.ureg.K
-        P0 = operation_conditions["initial_pressure"] * self.ureg.Pa
-        T = operation_conditions["final_temperature"] * self.ureg.K
-        P = operation_conditions["final_pressure"] * self.ureg.Pa
-        
-        var_operation_conditions = (P0 * T / (P * T0)).magnitude
-        
-        def objective(X_val):
-            if not (0 < X_val < 1):
-                raise ValueError("Conversion out of bounds")
-            
-            dilution_factor = (1 + (ε_base * X_val)) * var_operation_conditions
-            
-            outlet_concentrations, k, r = self._calculate_concentration_and_rate(
-                components, stoichiometric_coefficients, reaction_rate_params, 
-                limiting, C0_i, C_lim0, X_val, dilution_factor
-            )
-            
-            if any(Ci.magnitude < 0 for Ci in outlet_concentrations.values()):
-                raise ValueError("Ci is negative")
-                
-            rate_lim = abs(stoichiometric_coefficients[limiting]) * r
-            X_calc = (rate_lim * V / F_A0).to_base_units().magnitude
-            return X_calc - X_val
+        ε_base = self._dilution_slope(components, stoichiometric_coefficients, limiting) * (inlet.F0[limiting] / sum(inlet.F0))
         
-        result = root_scalar(objective, bracket=[1e-6, 0.999], method='brentq')
-        if not result.converged:
-            raise ValueError("Failed to converge to a valid conversion value.")
+        var_operation_conditions = self._operating_factor(operation_conditions)
         
-        X = result.root * self.ureg.dimensionless
+        # The root finder works on plain SI magnitudes; quantities are only rebuilt for the result
+        C_in, slopes, used_up = _linear_concentrations(
+            inlet.C0, stoichiometric_coefficients, limiting)
+        orders = tuple(reaction_rate_params["reaction_orders"])
+        scale = (abs(stoichiometric_coefficients[limiting]) * float(reaction_rate_params["k"])
+                 * V.magnitude * _conversion_factor(V.units, _U_M3) / inlet.F0[limiting])
+        eps = float(ε_base)
+
+        X_root = _solve_conversion(1e-6, 0.999,
+                                   (C_in, slopes, used_up, orders, eps, var_operation_conditions, scale), check_negative=True)
+        X = X_root * self.ureg.dimensionless
         
         dilution_factor = (1 + (ε_base * X)) * var_operation_conditions
         outlet_concentrations, k, r = self._calculate_concentration_and_rate(
                 components, stoichiometric_coefficients, reaction_rate_params, 
-                limiting, C0_i, C_lim0, X, dilution_factor
+                limiting, inlet.C0, X, dilution_factor
             )
         
         return {
@@ -343,45 +416,48 @@ class ReactorIsothermalHeterogeneous(BaseValidator):
         X = parameters["conversion"] * self.ureg.dimensionless  # dimensionless
         R = parameters["recycling_ratio"] * self.ureg.dimensionless  # dimensionless
 
-        limiting = self.determine_limiting_reagent(parameters)
+        inlet = self._inlet_state(parameters)
+        limiting = inlet.limiting
+        F_A0 = inlet.F0[limiting] * _U_MOL_PER_S  # mol/s for the limiting reagent
+        Q_tot = inlet.Q_tot * _U_M3_PER_S
 
-        F0_i = []
-        Q_tot = 0 * self.ureg.m**3 / self.ureg.s  # initialize with zero, with unit
-        for c in components:
-            flow_rate = c["flow_rate_inlet"] * self.ureg.m**3 / self.ureg.s
-            conc = (c["molar_concentration_inlet"] * self.ureg.mol / self.ureg.L).to(self.ureg.mol / self.ureg.m**3)
-            F0_i.append(flow_rate * conc)  # mol/s for each component
-            Q_tot += flow_rate
+        var_operation_conditions = self._operating_factor(operation_conditions)
 
-        F_A0 = F0_i[limiting]  # mol/s for the limiting reagent
-        C0_i = [F0 / Q_tot for F0 in F0_i]  # concentrations after mixing (mol/m³)
-        C_lim0 = C0_i[limiting]
+        # The integrand works on plain SI floats, everything it needs is fixed before integrating
+        C0 = np.array(inlet.C0)
+        ε_slope = self._dilution_slope(components, stoichiometric_coefficients, limiting)
+        nu_lim = abs(stoichiometric_coefficients[limiting])
+        orders, k_value = reaction_rate_params["reaction_orders"], reaction_rate_params["k"]
 
-        # Define the rate function for integration
+        # Define the rate function for integration (accepts an array of conversions)
         def rate_function(X_val):
-            dilution_factor = (1 + (self._calculate_dilution_factor(components, stoichiometric_coefficients, limiting, X_val))) * (operation_conditions["initial_pressure"] * operation_conditions["final_temperature"] / (operation_conditions["final_pressure"] * operation_conditions["initial_temperature"]))
-            outlet_concentrations, k, r = self._calculate_concentration_and_rate(
-                components, stoichiometric_coefficients, reaction_rate_params, 
-                limiting, C0_i, C_lim0, X_val, dilution_factor
-            )
-            return abs(stoichiometric_coefficients[limiting]) * r.magnitude
-
-        # Calculate the volume using numerical integration
-        
-        integral, _ = quad(lambda x: 1 / rate_function(x), (R/(R+1)*X).magnitude, X.magnitude)
-
-        V = (R+1) * F_A0 * integral * self.ureg.m**3  # m³
+            dilution_factor = (1 + ε_slope * X_val) * var_operation_conditions
+            concentrations = _outlet_concentrations(X_val, C0, stoichiometric_coefficients, limiting, dilution_factor)
+            return nu_lim * _reaction_rate(concentrations, orders, k_value)
+
+        # Calculate the volume using numerical integration: the integrand is smooth away from
+        # full conversion, where 16 nodes are exact to round-off; otherwise fall back to quad
+        a, b = (R/(R+1)*X).magnitude, X.magnitude
+        _require_positive_dilution((1 + ε_slope * np.array([a, b])) * var_operation_conditions)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            integral = _gauss_legendre(lambda x: 1 / rate_function(x), a, b, _GL16)
+            check = _gauss_legendre(lambda x: 1 / rate_function(x), a, b, _GL8)
+            if not abs(integral - check) <= 1e-10 * abs(integral):
+                try:
+                    integral, _ = quad(lambda x: 1 / float(rate_function(x)), a, b)
+                except ZeroDivisionError:
+                    integral = np.inf
+        if not np.isfinite(integral):
+            raise ValueError("The reaction rate cannot be zero or undefined in the conversion range.")
+
+        V = (R+1) * F_A0 * integral * _U_M3  # m³
         
         # Calcular o fator de diluição final e as concentrações no reator
-        ε = self._calculate_dilution_factor(components, stoichiometric_coefficients, limiting, X)
-        T0 = operation_conditions["initial_temperature"] * self.ureg.K
-        P0 = operation_conditions["initial_pressure"] * self.ureg.Pa
-        T = operation_conditions["final_temperature"] * self.ureg.K
-        P = operation_conditions["final_pressure"] * self.ureg.Pa
-        dilution_factor = (1 + ε) * (P0 * T / (P * T0)).magnitude
+        ε = ε_slope * X
+        dilution_factor = (1 + ε) * var_operation_conditions
         outlet_concentrations, k, r = self._calculate_concentration_and_rate(
             components, stoichiometric_coefficients, reaction_rate_params, 
-            limiting, C0_i, C_lim0, X, dilution_factor
+            limiting, inlet.C0, X, dilution_factor
         )
 
         return {
@@ -405,49 +481,31 @@ class ReactorIsothermalHeterogeneous(BaseValidator):
         stoichiometric_coefficients = parameters["stoichiometric_coefficients"]
         reaction_rate_params = parameters["reaction_rate_params"]
         operation_conditions = parameters["operation_conditions"]
-        V = parameters["volume"] * self.ureg.m**3  # volume in cubic meters
-
-        limiting = self.determine_limiting_reagent(parameters)
-
-        F0_i = []
-        Q_tot = 0 * self.ureg.m**3 / self.ureg.s  # initialize with zero, with unit
-        for c in components:
-            flow_rate = c["flow_rate_inlet"] * self.ureg.m**3 / self.ureg.s
-            conc = (c["molar_concentration_inlet"] * self.ureg.mol / self.ureg.L).to(self.ureg.mol / self.ureg.m**3)
-            F0_i.append(flow_rate * conc)  # mol/s for each component
-            Q_tot += flow_rate
-
-        F_A0 = F0_i[limiting]  # mol/s for the limiting reagent
-        C0_i = [F0 / Q_tot for F0 in F0_i]  # concentrations after mixing (mol/m³)
-        C_lim0 = C0_i[limiting]
-
-        T0 = operation_conditions["initial_temperature"] * self.ureg.K
-        P0 = operation_conditions["initial_pressure"] * self.ureg.Pa
-        T = operation_conditions["final_temperature"] * self.ureg.K
-        P = operation_conditions["final_pressure"] * self.ureg.Pa
-
-        def objective(X_val):
-            ε = self._calculate_dilution_factor(components, stoichiometric_coefficients, limiting, X_val)
-            dilution_factor = (1 + ε) * (P0 * T / (P * T0)).magnitude
-            outlet_concentrations, k, r = self._calculate_concentration_and_rate(
-                components, stoichiometric_coefficients, reaction_rate_params, 
-                limiting, C0_i, C_lim0, X_val, dilution_factor
-            )
-            rate_lim = abs(stoichiometric_coefficients[limiting]) * r
-            X_calc = (rate_lim * V / F_A0).to_base_units().magnitude
-            return X_calc - X_val
-
-        result = root_scalar(objective, bracket=[1e-6, 0.99999], method='brentq')
-        if not result.converged:
-            raise ValueError("Failed to converge to a valid conversion value.")
-
-        X = result.root * self.ureg.dimensionless
-
-        ε = self._calculate_dilution_factor(components, stoichiometric_coefficients, limiting, X)
-        dilution_factor = (1 + ε) * (P0 * T / (P * T0)).magnitude
+        V = parameters["volume"] * _U_M3  # volume in cubic meters
+
+        inlet = self._inlet_state(parameters)
+        limiting = inlet.limiting
+        F_A0 = inlet.F0[limiting] * _U_MOL_PER_S  # mol/s for the limiting reagent
+        Q_tot = inlet.Q_tot * _U_M3_PER_S
+
+        # The root finder works on plain SI magnitudes; quantities are only rebuilt for the result
+        C_in, slopes, used_up = _linear_concentrations(
+            inlet.C0, stoichiometric_coefficients, limiting)
+        orders = tuple(reaction_rate_params["reaction_orders"])
+        scale = (abs(stoichiometric_coefficients[limiting]) * float(reaction_rate_params["k"])
+                 * V.magnitude * _conversion_factor(V.units, _U_M3) / inlet.F0[limiting])
+        eps = self._dilution_slope(components, stoichiometric_coefficients, limiting)  # ε = eps·X
+        var_operation_conditions = self._operating_factor(operation_conditions)
+
+        X_root = _solve_conversion(1e-6, 0.99999,
+                                   (C_in, slopes, used_up, orders, eps, var_operation_conditions, scale))
+        X = X_root * self.ureg.dimensionless
+
+        ε = self._dilution_slope(components, stoichiometric_coefficients, limiting) * X
+        dilution_factor = (1 + ε) * var_operation_conditions
         outlet_concentrations, k, r = self._calculate_concentration_and_rate(
             components, stoichiometric_coefficients, reaction_rate_params, 
-            limiting, C0_i, C_lim0, X, dilution_factor
+            limiting, inlet.C0, X, dilution_factor
         )
 
         return {
@@ -473,51 +531,32 @@ class ReactorIsothermalHeterogeneous(BaseValidator):
         operation_conditions = parameters["operation_conditions"]
         residence_time = parameters["residence_time"] * self.ureg.s  # residence time in seconds
 
-        limiting = self.determine_limiting_reagent(parameters)
-
-        F0_i = []
-        Q_tot = 0 * self.ureg.m**3 / self.ureg.s  # initialize with zero, with unit
-        for c in components:
-            flow_rate = c["flow_rate_inlet"] * self.ureg.m**3 / self.ureg.s
-            conc = (c["molar_concentration_inlet"] * self.ureg.mol / self.ureg.L).to(self.ureg.mol / self.ureg.m**3)
-            F0_i.append(flow_rate * conc)  # mol/s for each component
-            Q_tot += flow_rate
-
-        F_A0 = F0_i[limiting]  # mol/s for the limiting reagent
-        C0_i = [F0 / Q_tot for F0 in F0_i]  # concentrations after mixing (mol/m³)
-        C_lim0 = C0_i[limiting]
+        inlet = self._inlet_state(parameters)
+        limiting = inlet.limiting
+        F_A0 = inlet.F0[limiting] * _U_MOL_PER_S  # mol/s for the limiting reagent
+        Q_tot = inlet.Q_tot * _U_M3_PER_S
 
         # Reactor volume based on residence time
         V = Q_tot * residence_time  # m³
 
-        T0 = operation_conditions["initial_temperature"] * self.ureg.K
-        P0 = operation_conditions["initial_pressure"] * self.ureg.Pa
-        T = operation_conditions["final_temperature"] * self.ureg.K
-        P = operation_conditions["final_pressure"] * self.ureg.Pa
-
-        def objective(X_val):
-            ε = self._calculate_dilution_factor(components, stoichiometric_coefficients, limiting, X_val)
-            dilution_factor = (1 + ε) * (P0 * T / (P * T0)).magnitude
-            
-            outlet_concentrations, k, r = self._calculate_concentration_and_rate(
-                components, stoichiometric_coefficients, reaction_rate_params, 
-                limiting, C0_i, C_lim0, X_val, dilution_factor
-            )
-            rate_lim = abs(stoichiometric_coefficients[limiting]) * r
-            X_calc = (rate_lim * V / F_A0).to_base_units().magnitude
-            return X_calc - X_val
-
-        result = root_scalar(objective, bracket=[1e-6, 0.999], method='brentq')
-        if not result.converged:
-            raise ValueError("Failed to converge to a valid conversion value.")
-
-        X = result.root * self.ureg.dimensionless
-
-        ε = self._calculate_dilution_factor(components, stoichiometric_coefficients, limiting, X)
-        dilution_factor = (1 + ε) * (P0 * T / (P * T0)).magnitude
+        # The root finder works on plain SI magnitudes; quantities are only rebuilt for the result
+        C_in, slopes, used_up = _linear_concentrations(
+            inlet.C0, stoichiometric_coefficients, limiting)
+        orders = tuple(reaction_rate_params["reaction_orders"])
+        scale = (abs(stoichiometric_coefficients[limiting]) * float(reaction_rate_params["k"])
+                 * V.magnitude * _conversion_factor(V.units, _U_M3) / inlet.F0[limiting])
+        eps = self._dilution_slope(components, stoichiometric_coefficients, limiting)  # ε = eps·X
+        var_operation_conditions = self._operating_factor(operation_conditions)
+
+        X_root = _solve_conversion(1e-6, 0.999,
+                                   (C_in, slopes, used_up, orders, eps, var_operation_conditions, scale))
+        X = X_root * self.ureg.dimensionless
+
+        ε = self._dilution_slope(components, stoichiometric_coefficients, limiting) * X
+        dilution_factor = (1 + ε) * var_operation_conditions
         outlet_concentrations, k, r = self._calculate_concentration_and_rate(
                 components, stoichiometric_coefficients, reaction_rate_params, 
-                limiting, C0_i, C_lim0, X, dilution_factor
+                limiting, inlet.C0, X, dilution_factor
             )
 
         return {
@@ -604,29 +643,58 @@ class ReactorIsothermalHeterogeneous(BaseValidator):
         # Generate conversion points
         conversion_points = np.linspace(0.01, max_conversion, num_points)
         
-        # Initialize lists for volumes
-        volumes_cstr = []
-        volumes_pfr = []
-        
-        # Calculate volumes for CSTR
-        for x in conversion_points:
-            cstr_params = parameters.copy()
-            cstr_params["conversion"] = x
-            cstr_params["input_type"] = "conversion_and_kinetics"
-            result = self._conversion_and_kinetics_in_cstr(cstr_params)
-            volumes_cstr.append(result["volume"].magnitude)
-        
-        # Calculate volumes for PFR
-        for x in conversion_points:
-            pfr_params = parameters.copy()
-            pfr_params["conversion"] = x
-            pfr_params["recycling_ratio"] = recycling_ratio_pfr
-            pfr_params["input_type"] = "conversion_and_kinetics"
-            result = self._conversion_and_kinetics_in_pfr(pfr_params)
-            volumes_pfr.append(result["volume"].magnitude)
+        # Both curves are evaluated for all conversions at once, on plain SI magnitudes
+        components = parameters["components"]
+        stoichiometric_coefficients = parameters["stoichiometric_coefficients"]
+        reaction_rate_params = parameters["reaction_rate_params"]
+        operation_conditions = parameters["operation_conditions"]
+        self._validate_numeric({"recycling_ratio": recycling_ratio_pfr}, ["recycling_ratio"])
+
+        self._require_single_phase(components)
+
+        inlet = self._inlet_state(parameters)
+        limiting = inlet.limiting
+        F_A0 = inlet.F0[limiting]
+        C0 = np.array(inlet.C0)
+        nu_lim = abs(stoichiometric_coefficients[limiting])
+        orders, k = reaction_rate_params["reaction_orders"], reaction_rate_params["k"]
+        var_operation_conditions = self._operating_factor(operation_conditions)
+
+        ε_slope = self._dilution_slope(components, stoichiometric_coefficients, limiting)
+
+        # CSTR: V = F_A0·X / (|ν_lim|·r(X)), explicit in X
+        X = conversion_points
+        ε = ε_slope * X * (F_A0 / sum(inlet.F0))
+        dilution = (1 + ε * X) * var_operation_conditions
+        _require_positive_dilution(dilution)
+        C = _outlet_concentrations(X, C0, stoichiometric_coefficients, limiting, dilution)
+        r = _reaction_rate(C, orders, k)
+        negative, zero_rate = (C < 0).any(axis=-1), r == 0
+        if (negative | zero_rate).any():
+            first = np.flatnonzero(negative | zero_rate)[0]
+            raise ValueError("Too high conversion — negative concentration calculated." if negative[first]
+                             else "The reaction rate cannot be zero.")
+        volumes_cstr = F_A0 * X / (nu_lim * r)
+
+        # PFR: V = (R+1)·F_A0·∫ dX/(|ν_lim|·r) from R/(R+1)·X to X, read off one cumulative integral
+        def inverse_rate(x):
+            dilution = (1 + ε_slope * x) * var_operation_conditions
+            return 1 / (nu_lim * _reaction_rate(_outlet_concentrations(x, C0, stoichiometric_coefficients, limiting, dilution), orders, k))
+
+        R = recycling_ratio_pfr
+        lower = R / (R + 1) * X
+        points = np.unique(np.concatenate(([0.0], lower, X)))
+        _require_positive_dilution((1 + ε_slope * points[[0, -1]]) * var_operation_conditions)
+        with np.errstate(divide="ignore"):
+            integral = _cumulative_integral(inverse_rate, points)
+        if not np.isfinite(integral).all():
+            raise ValueError("The reaction rate cannot be zero.")
+        volumes_pfr = (R + 1) * F_A0 * (integral[np.searchsorted(points, X)] - integral[np.searchsorted(points, lower)])
         
         # Create graph
-        fig, ax = plt.subplots(figsize=(10, 6))
+        # Built without pyplot: nothing is registered globally, so there is no figure to close
+        fig = Figure(figsize=(10, 6))
+        ax = fig.subplots()
         
         # Plot curves
         ax.plot(volumes_cstr, conversion_points, 'b-', linewidth=2, label='CSTR')
@@ -640,10 +708,10 @@ class ReactorIsothermalHeterogeneous(BaseValidator):
         ax.legend(fontsize=12)
         
         # Adjust limits and format
-        ax.set_xlim(0, max(max(volumes_cstr), max(volumes_pfr)) * 1.1)
+        ax.set_xlim(0, max(volumes_cstr.max(), volumes_pfr.max()) * 1.1)
         ax.set_ylim(0, max_conversion * 1.1)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         return fig, ax
 
@@ -673,10 +741,10 @@ class ReactorIsothermalHeterogeneous(BaseValidator):
                 raise ValueError(f"Stoichiometric coefficient for component {component['component_name']} is zero.")
     
             if coef < 0:  # It's a reactant
-                flow_rate = component["flow_rate_inlet"] * self.ureg.m**3 / self.ureg.s
-                molar_concentration = (component["molar_concentration_inlet"] * self.ureg.mol / self.ureg.L).to(self.ureg.mol / self.ureg.m**3)
+                flow_rate = component["flow_rate_inlet"]  # m³/s
+                molar_concentration = component["molar_concentration_inlet"] * _MOL_PER_L_TO_MOL_PER_M3  # mol/m³
                 
-                ratio = (flow_rate * molar_concentration / abs(coef)).magnitude  # mol/s per mol
+                ratio = flow_rate * molar_concentration / abs(coef)  # mol/s per mol
     
                 if ratio < min_ratio:
                     min_ratio = ratio
@@ -8,7 +8,7 @@ hydraulic = Hydraulic()
 
 
 @router.post("/reynolds")
-def calculate_reynolds(payload: ReynoldsRequest):
+async def calculate_reynolds(payload: ReynoldsRequest):
     try:
         params = {
             "characteristic_diameter": payload.characteristic_diameter,  # mm
@@ -28,12 +28,12 @@ def calculate_reynolds(payload: ReynoldsRequest):
 
 
 @router.get("/friction-factor/methods")
-def get_friction_factor_methods():
+async def get_friction_factor_methods():
     return hydraulic.friction_factor({})
 
 
 @router.post("/friction-factor")
-def calculate_friction_factor(payload: FrictionFactorRequest):
+async def calculate_friction_factor(payload: FrictionFactorRequest):
     try:
         result = hydraulic.friction_factor({
             "roughness": payload.roughness,    # mm
@@ -47,12 +47,12 @@ def calculate_friction_factor(payload: FrictionFactorRequest):
 
 
 @router.get("/hydraulic-diameter/shapes")
-def get_hydraulic_diameter_shapes():
+async def get_hydraulic_diameter_shapes():
     return hydraulic.hydraulic_diameter({})
 
 
 @router.post("/hydraulic-diameter")
-def calculate_hydraulic_diameter(payload: HydraulicDiameterRequest):
+async def calculate_hydraulic_diameter(payload: HydraulicDiameterRequest):
     try:
         params = {
             "shape": payload.shape
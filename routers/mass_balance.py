@@ -1,10 +1,10 @@
 import base64
 from io import BytesIO
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import numpy as np
 
 from models import MassBalance
@@ -14,7 +14,11 @@ router = APIRouter(prefix="/mass-balance", tags=["Mass Balance"])
 
 
 @router.post("/calculate")
-def calculate_mass_balance(payload: MassBalanceRequest):
+async def calculate_mass_balance(payload: MassBalanceRequest):
+    return await run_in_threadpool(_calculate_mass_balance, payload)
+
+
+def _calculate_mass_balance(payload: MassBalanceRequest):
     try:
         # Validate stream compositions before creating the mass balance model
         for stream in payload.streams:
@@ -121,7 +125,29 @@ def calculate_mass_balance(payload: MassBalanceRequest):
 
 
 @router.post("/plot")
-def plot_mass_balance(payload: MassBalanceRequest):
+async def plot_mass_balance(payload: MassBalanceRequest):
+    """
+    Returns the mass balance plot as raw image/png
+    """
+    result = await run_in_threadpool(_plot_mass_balance, payload)
+    if isinstance(result, JSONResponse):
+        return result
+    # Served straight from the render buffer, without copying or re-encoding it
+    return Response(content=result.getbuffer(), media_type="image/png")
+
+
+@router.post("/plot.json")
+async def plot_mass_balance_json(payload: MassBalanceRequest):
+    """
+    Same plot as /mass-balance/plot, base64-encoded in JSON for clients that need it
+    """
+    result = await run_in_threadpool(_plot_mass_balance, payload)
+    if isinstance(result, JSONResponse):
+        return result
+    return {"image_base64": base64.b64encode(result.getbuffer()).decode('utf-8')}
+
+
+def _plot_mass_balance(payload: MassBalanceRequest):
     try:
         # Validate stream compositions before creating the mass balance model
         for stream in payload.streams:
@@ -186,7 +212,9 @@ def plot_mass_balance(payload: MassBalanceRequest):
                 raise HTTPException(status_code=400, detail=str(error_message))
             
             # Create a figure with subplots
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+            # Agg canvas without pyplot: safe in the threadpool and nothing left to close
+            fig = Figure(figsize=(12, 5))
+            ax1, ax2 = fig.subplots(1, 2)
             
             # Get stream names and flow rates
             streams = list(results.keys())
@@ -217,7 +245,7 @@ def plot_mass_balance(payload: MassBalanceRequest):
             ax2.set_ylim(0, 1)
             ax2.legend()
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             # Add a text annotation explaining units
             fig.text(0.5, 0.01, 
@@ -225,17 +253,11 @@ def plot_mass_balance(payload: MassBalanceRequest):
                     'Compositions are mass fractions when using mass flow units or molar fractions when using molar flow units.',
                     ha='center', fontsize=8, style='italic')
             
-            # Save the figure to a BytesIO object and encode as base64
+            # Save the figure as PNG to a BytesIO object
             buffer = BytesIO()
-            fig.savefig(buffer, format='png')
-            buffer.seek(0)
-            
-            # Encode the image to base64
-            image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
+            FigureCanvasAgg(fig).print_png(buffer)
             
-            plt.close(fig)  # Close figure to free memory
-            
-            return {"image_base64": image_base64}
+            return buffer
         except ValueError as validation_error:
             # Catch and properly raise validation errors
             return JSONResponse(
@@ -248,7 +270,7 @@ def plot_mass_balance(payload: MassBalanceRequest):
 
 
 @router.get("/example")
-def get_mass_balance_example():
+async def get_mass_balance_example():
     """
     Returns an example mass balance configuration based on example_mass_balance.py
     This can be used as a template for the /mass-balance/calculate and /mass-balance/plot endpoints
@@ -308,10 +330,14 @@ def get_mass_balance_example():
 
 
 @router.post("/yields")
-def calculate_yields(payload: MassBalanceRequest):
+async def calculate_yields(payload: MassBalanceRequest):
     """
     Calculate yield metrics based on mass balance results
     """
+    return await run_in_threadpool(_calculate_yields, payload)
+
+
+def _calculate_yields(payload: MassBalanceRequest):
     try:
         # Validate stream compositions before creating the mass balance model
         for stream in payload.streams:
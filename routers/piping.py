@@ -7,12 +7,12 @@ piping = Piping()
 
 
 @router.get("/compositions")
-def get_compositions():
+async def get_compositions():
     return piping.compositions()
 
 
 @router.get("/composition/{name}")
-def get_composition_specifications(name: str):
+async def get_composition_specifications(name: str):
     try:
         # Return enhanced composition details
         return serialize(piping.composition_specifications(name))
@@ -21,13 +21,13 @@ def get_composition_specifications(name: str):
 
 
 @router.get("/schedules")
-def get_schedules():
+async def get_schedules():
     # Returns an array of schedules with their available diameters
     return piping.schedules()
 
 
 @router.get("/schedule/{schedule}/diameters")
-def get_schedule_diameters(schedule: str):
+async def get_schedule_diameters(schedule: str):
     try:
         # Returns diameters with basic information
         return piping.diameters(schedule)
@@ -36,7 +36,7 @@ def get_schedule_diameters(schedule: str):
 
 
 @router.get("/schedule/{schedule}/diameter/{diameter}")
-def get_schedule_diameter_specifications(schedule: str, diameter: float):
+async def get_schedule_diameter_specifications(schedule: str, diameter: float):
     try:
         return serialize(piping.diameter_specifications(schedule, diameter))
     except Exception as exc:
@@ -44,12 +44,12 @@ def get_schedule_diameter_specifications(schedule: str, diameter: float):
 
 
 @router.get("/fittings")
-def get_fittings():
+async def get_fittings():
     return piping.fittings()
 
 
 @router.get("/fitting/{name}")
-def get_fitting_specifications(name: str):
+async def get_fitting_specifications(name: str):
     try:
         # Return enhanced fitting details
         return serialize(piping.fitting_specifications(name))
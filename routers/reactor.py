@@ -1,6 +1,9 @@
 import base64
 from io import BytesIO
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
+from fastapi.concurrency import run_in_threadpool
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from models import ReactorIsothermalHeterogeneous
 from schemas import ReactorRequest, ReactorPlotRequest
 from .utils import serialize
@@ -10,12 +13,12 @@ reactor_isothermal = ReactorIsothermalHeterogeneous()
 
 
 @router.get("/cstr/calculation-types")
-def get_cstr_calculation_types():
+async def get_cstr_calculation_types():
     return reactor_isothermal.cstr({})
 
 
 @router.post("/cstr")
-def calculate_cstr(payload: ReactorRequest):
+async def calculate_cstr(payload: ReactorRequest):
     try:
         # Convert from pydantic model to the expected format
         components = []
@@ -44,7 +47,7 @@ def calculate_cstr(payload: ReactorRequest):
         elif payload.input_type == "residence_time_and_kinetics":
             params["residence_time"] = payload.residence_time
         
-        result = reactor_isothermal.cstr(params)
+        result = await run_in_threadpool(reactor_isothermal.cstr, params)
         
         # Use the serialize function to convert pint quantities to serializable format
         return serialize(result)
@@ -53,12 +56,12 @@ def calculate_cstr(payload: ReactorRequest):
 
 
 @router.get("/pfr/calculation-types")
-def get_pfr_calculation_types():
+async def get_pfr_calculation_types():
     return reactor_isothermal.pfr({})
 
 
 @router.post("/pfr")
-def calculate_pfr(payload: ReactorRequest):
+async def calculate_pfr(payload: ReactorRequest):
     try:
         # Convert from pydantic model to the expected format
         components = []
@@ -88,7 +91,7 @@ def calculate_pfr(payload: ReactorRequest):
         elif payload.input_type == "residence_time_and_kinetics":
             params["residence_time"] = payload.residence_time
         
-        result = reactor_isothermal.pfr(params)
+        result = await run_in_threadpool(reactor_isothermal.pfr, params)
         
         # Use the serialize function to convert pint quantities to serializable format
         return serialize(result)
@@ -97,7 +100,7 @@ def calculate_pfr(payload: ReactorRequest):
 
 
 @router.post("/limiting-reagent")
-def calculate_limiting_reagent(payload: ReactorRequest):
+async def calculate_limiting_reagent(payload: ReactorRequest):
     try:
         # Convert from pydantic model to the expected format
         components = []
@@ -115,7 +118,7 @@ def calculate_limiting_reagent(payload: ReactorRequest):
             "stoichiometric_coefficients": payload.stoichiometric_coefficients
         }
         
-        limiting_index = reactor_isothermal.determine_limiting_reagent(params)
+        limiting_index = await run_in_threadpool(reactor_isothermal.determine_limiting_reagent, params)
         return {
             "limiting_reagent": components[limiting_index]["component_name"]
         }
@@ -124,7 +127,20 @@ def calculate_limiting_reagent(payload: ReactorRequest):
 
 
 @router.post("/plot-conversion-vs-volume")
-def plot_conversion_vs_volume(payload: ReactorPlotRequest):
+async def plot_conversion_vs_volume(payload: ReactorPlotRequest):
+    buffer = await _render_conversion_plot(payload)
+    # Served straight from the render buffer as image/png, without copying or re-encoding it
+    return Response(content=buffer.getbuffer(), media_type="image/png")
+
+
+@router.post("/plot-conversion-vs-volume.json")
+async def plot_conversion_vs_volume_json(payload: ReactorPlotRequest):
+    # Same plot, base64-encoded in JSON for clients that need it
+    buffer = await _render_conversion_plot(payload)
+    return {"image_base64": base64.b64encode(buffer.getbuffer()).decode('utf-8')}
+
+
+async def _render_conversion_plot(payload: ReactorPlotRequest):
     try:
         # Convert from pydantic model to the expected format
         components = []
@@ -147,17 +163,16 @@ def plot_conversion_vs_volume(payload: ReactorPlotRequest):
             "recycling_ratio_pfr": payload.recycling_ratio
         }
         
-        fig, ax = reactor_isothermal.plot_conversion_vs_volume(params)
-        
-        # Save the figure to a BytesIO object and encode as base64
-        buffer = BytesIO()
-        fig.savefig(buffer, format='png')
-        buffer.seek(0)
-        
-        # Encode the image to base64
-        image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-        
-        return {"image_base64": image_base64}
+        return await run_in_threadpool(_draw_conversion_plot, params)
     except Exception as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
+
+def _draw_conversion_plot(params):
+    """Solves and renders the conversion vs volume plot; returns the PNG in a BytesIO."""
+    fig, ax = reactor_isothermal.plot_conversion_vs_volume(params)
+    
+    # Save the figure as PNG to a BytesIO object
+    buffer = BytesIO()
+    FigureCanvasAgg(fig).print_png(buffer)
+    return buffer
@@ -1,12 +1,22 @@
+from collections.abc import Mapping
 from typing import Any
+import orjson
+from fastapi.responses import JSONResponse
 from pint import Quantity
 
 
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (numpy arrays and non-str keys allowed)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
 def serialize(obj: Any) -> Any:
     """Recursively convert pint.Quantity into JSON‑serialisable structures."""
     if Quantity is not None and isinstance(obj, Quantity):
         return {"value": obj.magnitude, "units": str(obj.units)}
-    if isinstance(obj, dict):
+    if isinstance(obj, Mapping):
         return {k: serialize(v) for k, v in obj.items()}
     if isinstance(obj, list):
         return [serialize(i) for i in obj]
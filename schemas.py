@@ -306,6 +306,26 @@ class PropertyRequest(BaseModel):
     pressure: float = Field(..., gt=0, description="Pressure in Pa")
 
 
+class PropertiesRequest(BaseModel):
+    fluid: str = Field(..., description="Name of the fluid")
+    property_names: List[str] = Field(..., description="List of property keys to retrieve (CoolProp format)")
+    temperature: float = Field(..., gt=0, description="Temperature in K")
+    pressure: float = Field(..., gt=0, description="Pressure in Pa")
+
+
+class BatchPropertiesRequest(BaseModel):
+    fluid: str = Field(..., description="Name of the fluid")
+    properties: List[str] = Field(..., description="List of property keys to retrieve (CoolProp format)")
+    temperatures: List[float] = Field(..., description="Temperatures in K")
+    pressures: List[float] = Field(..., description="Pressures in Pa (one per temperature)")
+
+    @model_validator(mode='after')
+    def check_lengths(self):
+        if len(self.temperatures) != len(self.pressures):
+            raise ValueError("Temperatures and pressures must have the same length")
+        return self
+
+
 class MixturePropertiesRequest(BaseModel):
     fluid_fractions: Dict[str, float] = Field(..., description="Dictionary with fluid names as keys and their mass fractions as values")
     temperature: float = Field(..., gt=0, description="Temperature in K")
@@ -316,3 +336,7 @@ class MixturePropertiesRequest(BaseModel):
 class FluidRequest(BaseModel):
     fluid: str = Field(..., description="Name of the fluid")
 
+
+class FluidsRequest(BaseModel):
+    fluids: List[str] = Field(..., description="List of fluid names")
+